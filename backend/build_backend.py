@@ -8,8 +8,62 @@ import os
 import sys
 import subprocess
 import shutil
+import tempfile
+import re
 from pathlib import Path
 
+def compile_dsl_extension(backend_dir, staging_dir):
+    """Compile the DSL dataclasses with mypyc when it is available.
+
+    ``horary_engine/dsl.py`` is copied into ``staging_dir`` and compiled
+    there, so the source tree never gains an extension module that would
+    shadow the pure-Python DSL.  The staged copy imports ``models``
+    absolutely, which is the import the frozen executable resolves anyway;
+    mypyc cannot compile the relative ``..models`` fallback.  Returns the
+    compiled extension files for PyInstaller to bundle, or an empty list
+    when compilation is skipped or fails.  Set ``HORARY_DISABLE_MYPYC=1``
+    to skip this step.
+    """
+
+    if os.environ.get("HORARY_DISABLE_MYPYC", "").lower() in {"1", "true", "yes"}:
+        print("Skipping mypyc compilation (HORARY_DISABLE_MYPYC set)")
+        return []
+
+    package_dir = staging_dir / "horary_engine"
+    package_dir.mkdir(parents=True, exist_ok=True)
+    (package_dir / "__init__.py").write_text("")
+
+    source = (backend_dir / "horary_engine" / "dsl.py").read_text(encoding="utf-8")
+    source = re.sub(
+        r"try:\n    from \.\.models import (.*)\nexcept ImportError:.*\n    from models import .*\n",
+        r"from models import \1\n",
+        source,
+    )
+    (package_dir / "dsl.py").write_text(source, encoding="utf-8")
+
+    mypyc_cmd = [
+        sys.executable, "-m", "mypyc",
+        "--ignore-missing-imports",
+        "--follow-imports=skip",
+        str(Path("horary_engine") / "dsl.py"),
+    ]
+    print(f"Compiling DSL with mypyc: {' '.join(mypyc_cmd)}")
+
+    try:
+        subprocess.run(mypyc_cmd, check=True, cwd=staging_dir)
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"! mypyc compilation skipped, using pure-Python DSL: {e}")
+        return []
+
+    extensions = sorted(package_dir.glob("*.so")) + sorted(package_dir.glob("*.pyd"))
+    if not extensions:
+        print("! mypyc produced no extension, using pure-Python DSL")
+        return []
+
+    print("✓ DSL compiled with mypyc")
+    return extensions
+
+
 def build_backend():
     """Build the backend into a standalone executable."""
     
@@ -47,6 +101,15 @@ def build_backend():
         str(app_py)
     ]
     
+    # Compiled DSL lives only in a scratch directory and inside the bundle;
+    # the pure-Python module is excluded so the extension is what gets imported.
+    staging_dir = Path(tempfile.mkdtemp(prefix="horary_mypyc_"))
+    dsl_extensions = compile_dsl_extension(backend_dir, staging_dir)
+    if dsl_extensions:
+        pyinstaller_cmd[-1:-1] = ["--exclude-module", "horary_engine.dsl"]
+        for extension in dsl_extensions:
+            pyinstaller_cmd[-1:-1] = ["--add-binary", f"{extension};horary_engine"]
+
     print("Building backend executable...")
     print(f"Command: {' '.join(pyinstaller_cmd)}")
     
@@ -79,6 +142,8 @@ def build_backend():
     except Exception as e:
         print(f"✗ Unexpected error: {e}")
         return None
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
 
 if __name__ == "__main__":
     exe_path = build_backend()
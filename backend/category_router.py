@@ -1,7 +1,9 @@
 """Category router mapping question categories to role contracts."""
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 try:
     from .models import Planet
@@ -11,16 +13,20 @@ except ImportError:  # pragma: no cover - fallback when executed as script
     from taxonomy import Category, get_defaults, resolve_category
 
 
-def get_contract(category: str | Category) -> Dict[str, Planet]:
+@lru_cache(maxsize=64)
+def get_contract(category: str | Category) -> Mapping[str, Planet]:
     """Return role contract for a given category.
 
     The function accepts either a :class:`Category` enum value or a legacy
     string. Passing a string will emit a deprecation warning via
-    :func:`resolve_category`.
+    :func:`resolve_category` the first time that string is resolved.
+
+    Results are cached per category and returned as read-only mappings so
+    callers cannot mutate the shared taxonomy defaults.
     """
 
     cat = resolve_category(category)
     if not cat:
-        return {}
+        return MappingProxyType({})
     defaults = get_defaults(cat)
-    return defaults.get("contract", {})
+    return MappingProxyType(dict(defaults.get("contract", {})))
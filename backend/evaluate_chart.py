@@ -2,7 +2,9 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional
 import os
 from pathlib import Path
 import sys
@@ -10,16 +12,42 @@ import sys
 # Ensure repository root on path when executed directly
 sys.path.append(str(Path(__file__).resolve().parents[1]))
 
-from horary_config import cfg
+from horary_config import HoraryError, get_config
 
 from category_router import get_contract
+from horary_engine.aggregator import aggregate as legacy_aggregate
+from horary_engine.dsl import L1, L10, L3, LQ, Moon, role_importance
 from horary_engine.engine import extract_testimonies
 from horary_engine.rationale import build_rationale
+from horary_engine.solar_aggregator import aggregate as dsl_aggregate
 from horary_engine.utils import token_to_string
 
 logger = logging.getLogger(__name__)
 
 
+def _resolve_default_use_dsl() -> bool:
+    """Resolve the aggregation default from ``HORARY_USE_DSL`` or configuration."""
+    env_override = os.getenv("HORARY_USE_DSL")
+    if env_override is not None:
+        return env_override.lower() in {"1", "true", "yes"}
+    try:
+        return bool(get_config().get("aggregator.use_dsl", False))
+    except HoraryError as e:
+        logger.warning(f"Falling back to legacy aggregator: {e}")
+        return False
+
+
+# Resolved once at import; call ``_invalidate`` after changing the
+# environment or configuration (e.g. in tests).
+_DEFAULT_USE_DSL = _resolve_default_use_dsl()
+
+
+def _invalidate() -> None:
+    """Re-read the aggregation default from the environment and configuration."""
+    global _DEFAULT_USE_DSL
+    _DEFAULT_USE_DSL = _resolve_default_use_dsl()
+
+
 def evaluate_chart(
     chart: Dict[str, Any], use_dsl: Optional[bool] = None
 ) -> Dict[str, Any]:
@@ -36,30 +64,18 @@ def evaluate_chart(
         chart: Parsed chart information.
         use_dsl: Optional override for the aggregation engine. If ``None`` the
             value is sourced from the ``HORARY_USE_DSL`` environment variable or
-            ``aggregator.use_dsl`` setting. This makes it easy for API callers to
-            supply a query or header flag without editing config files.
+            ``aggregator.use_dsl`` setting, resolved once at import. This makes
+            it easy for API callers to supply a query or header flag without
+            editing config files.
     """
     contract = get_contract(chart.get("category", ""))
     testimonies = extract_testimonies(chart, contract)
 
     if use_dsl is None:
-        env_override = os.getenv("HORARY_USE_DSL")
-        if env_override is not None:
-            use_dsl = env_override.lower() in {"1", "true", "yes"}
-        else:
-            use_dsl = cfg().get("aggregator.use_dsl", False)
+        use_dsl = _DEFAULT_USE_DSL
 
     if use_dsl:
-        from horary_engine.dsl import (
-            L1,
-            L10,
-            L3,
-            LQ,
-            Moon,
-            role_importance,
-        )
-        from horary_engine.solar_aggregator import aggregate as aggregator_fn
-
+        aggregator_fn = dsl_aggregate
         testimonies = [
             role_importance(L1, 1.0),
             role_importance(LQ, 1.0),
@@ -69,22 +85,50 @@ def evaluate_chart(
             *testimonies,
         ]
     else:
-        from horary_engine.aggregator import aggregate as aggregator_fn
+        aggregator_fn = legacy_aggregate
 
     score, ledger = aggregator_fn(testimonies)
-    # Surface ledger details for downstream inspection and debugging
-    logger.info(
-        "Contribution ledger: %s",
-        [
-            {**entry, "key": token_to_string(entry.get("key"))}
-            for entry in ledger
-        ],
-    )
+    # Surface ledger details for downstream inspection and debugging; the
+    # per-entry copies are only built when INFO output is actually enabled
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Contribution ledger: %s",
+            [
+                {**entry, "key": token_to_string(entry.get("key"))}
+                for entry in ledger
+            ],
+        )
     rationale = build_rationale(ledger)
     verdict = "YES" if score > 0 else "NO"
     return {"verdict": verdict, "ledger": ledger, "rationale": rationale}
 
 
+def evaluate_charts_batch(
+    charts: List[Dict[str, Any]],
+    use_dsl: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """Evaluate several charts in parallel worker processes.
+
+    Each chart is dispatched to :func:`evaluate_chart` on a process pool sized
+    to ``os.cpu_count()`` by default. Evaluation is pure-Python aggregation, so
+    processes rather than threads are needed for charts to run in parallel.
+
+    Args:
+        charts: Parsed chart dictionaries.
+        use_dsl: Aggregation override forwarded to every evaluation.
+        max_workers: Optional pool size override.
+
+    Returns:
+        Evaluation results in the same order as ``charts``.
+    """
+    if not charts:
+        return []
+    workers = min(max_workers or os.cpu_count() or 1, len(charts))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(partial(evaluate_chart, use_dsl=use_dsl), charts))
+
+
 if __name__ == "__main__":
     """Allow command-line evaluation of charts.
 
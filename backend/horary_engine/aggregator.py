@@ -3,13 +3,7 @@ from __future__ import annotations
 
 from typing import Iterable, List, Tuple, Dict, Sequence
 
-from .polarity_weights import (
-    POLARITY_TABLE,
-    WEIGHT_TABLE,
-    FAMILY_TABLE,
-    KIND_TABLE,
-    TestimonyKey,
-)
+from .polarity_weights import TestimonyKey, lookup
 from .polarity import Polarity
 
 
@@ -47,25 +41,19 @@ def aggregate(
     total_yes = 0.0
     total_no = 0.0
     ledger: List[Dict[str, float | TestimonyKey | Polarity | str | bool]] = []
-    seen: set[TestimonyKey] = set()
     families_seen: set[str] = set()
 
-    tokens = _coerce_tokens(testimonies)
-    for token in sorted(tokens, key=lambda t: t.value):
-        if token in seen:
-            continue
-        seen.add(token)
-        polarity = POLARITY_TABLE.get(token, Polarity.NEUTRAL)
+    # Single pass dedup; only the unique tokens are sorted afterwards
+    seen: Dict[TestimonyKey, None] = dict.fromkeys(_coerce_tokens(testimonies))
+    for token in sorted(seen, key=lambda t: t.value):
+        polarity, weight, family, kind = lookup(token)
         if polarity is Polarity.NEUTRAL:
             continue  # unknown or neutral token
 
-        family = FAMILY_TABLE.get(token)
-        kind = KIND_TABLE.get(token)
         context_only = family is not None and family in families_seen
         if family is not None and not context_only:
             families_seen.add(family)
 
-        weight = WEIGHT_TABLE.get(token, 0.0)
         if weight < 0:
             raise ValueError("Weights must be non-negative for monotonicity")
         delta_yes = weight if (not context_only and polarity is Polarity.POSITIVE) else 0.0
@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import datetime
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from itertools import combinations
 from typing import Callable, Dict, List, Optional, Tuple
 
 import swisseph as swe
@@ -15,6 +18,49 @@ except ImportError:  # pragma: no cover - fallback when executed as script
 from .calculation.helpers import days_to_sign_exit
 
 
+# Aspect degrees never change, so resolve the enum members once at import.
+# Orbs are configuration driven and are read once per calculation instead.
+# Entries are kept in ascending degree order so they can be bisected.
+_ASPECT_DEGREES: Tuple[Tuple[Aspect, float], ...] = tuple(
+    sorted(
+        ((aspect_type, aspect_type.degrees) for aspect_type in Aspect),
+        key=lambda entry: entry[1],
+    )
+)
+_SORTED_DEGREES: Tuple[float, ...] = tuple(deg for _, deg in _ASPECT_DEGREES)
+
+_jdut1_to_utc = swe.jdut1_to_utc
+
+
+def _aspect_orbs() -> List[Tuple[Aspect, float, float]]:
+    """Return ``(aspect, degrees, orb)`` triples for the current configuration."""
+
+    return [
+        (aspect_type, degrees, aspect_type.orb)
+        for aspect_type, degrees in _ASPECT_DEGREES
+    ]
+
+
+def _candidate_range(separation: float, widest_orb: float) -> range:
+    """Return indices into ``_ASPECT_DEGREES`` within ``widest_orb`` of ``separation``."""
+
+    return range(
+        bisect_left(_SORTED_DEGREES, separation - widest_orb),
+        bisect_right(_SORTED_DEGREES, separation + widest_orb),
+    )
+
+
+def _candidate_aspects(
+    separation: float,
+    aspect_orbs: List[Tuple[Aspect, float, float]],
+    widest_orb: float,
+) -> List[Tuple[Aspect, float, float]]:
+    """Return the aspects whose exact angle lies within ``widest_orb`` of ``separation``."""
+
+    candidates = _candidate_range(separation, widest_orb)
+    return aspect_orbs[candidates.start:candidates.stop]
+
+
 def calculate_moon_last_aspect(
     planets: Dict[Planet, PlanetPosition],
     jd_ut: float,
@@ -25,8 +71,13 @@ def calculate_moon_last_aspect(
     moon_pos = planets[Planet.MOON]
     moon_speed = get_moon_speed(jd_ut)
 
-    # Look back to find most recent separating aspect
-    separating_aspects: List[LunarAspect] = []
+    aspect_orbs = _aspect_orbs()
+    # Search window covers the widest (1.5x) separating orb of any aspect
+    widest_orb = max(orb for _, _, orb in aspect_orbs) * 1.5
+
+    # Look back to find most recent separating aspect, tracked as
+    # (time_since_exact, planet, aspect_type, orb_diff)
+    best: Optional[Tuple[float, Planet, Aspect, float]] = None
 
     for planet, planet_pos in planets.items():
         if planet == Planet.MOON:
@@ -37,10 +88,11 @@ def calculate_moon_last_aspect(
         if separation > 180:
             separation = 360 - separation
 
-        # Check each aspect type
-        for aspect_type in Aspect:
-            orb_diff = abs(separation - aspect_type.degrees)
-            max_orb = aspect_type.orb
+        # Check each aspect type near the current separation
+        for aspect_type, degrees, max_orb in _candidate_aspects(
+            separation, aspect_orbs, widest_orb
+        ):
+            orb_diff = abs(separation - degrees)
 
             # Wider orb for recently separating
             if orb_diff <= max_orb * 1.5:
@@ -48,31 +100,30 @@ def calculate_moon_last_aspect(
                 if is_moon_separating_from_aspect(
                     moon_pos, planet_pos, aspect_type, moon_speed
                 ):
-                    degrees_since_exact = orb_diff
                     relative_speed = moon_speed - planet_pos.speed
                     time_since_exact = (
-                        degrees_since_exact / abs(relative_speed)
+                        orb_diff / abs(relative_speed)
                         if relative_speed != 0
                         else float("inf")
                     )
 
-                    separating_aspects.append(
-                        LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=degrees_since_exact,
-                            perfection_eta_days=time_since_exact,
-                            perfection_eta_description=f"{time_since_exact:.1f} days ago",
-                            applying=False,
-                        )
-                    )
+                    # Keep most recent (smallest time_since_exact)
+                    if best is None or time_since_exact < best[0]:
+                        best = (time_since_exact, planet, aspect_type, orb_diff)
 
-    # Return most recent (smallest time_since_exact)
-    if separating_aspects:
-        return min(separating_aspects, key=lambda x: x.perfection_eta_days)
+    if best is None:
+        return None
 
-    return None
+    time_since_exact, planet, aspect_type, orb_diff = best
+    return LunarAspect(
+        planet=planet,
+        aspect=aspect_type,
+        orb=orb_diff,
+        degrees_difference=orb_diff,
+        perfection_eta_days=time_since_exact,
+        perfection_eta_description=f"{time_since_exact:.1f} days ago",
+        applying=False,
+    )
 
 
 def calculate_moon_next_aspect(
@@ -90,8 +141,11 @@ def calculate_moon_next_aspect(
     moon_speed = get_moon_speed(jd_ut)
     moon_days_to_exit = days_to_sign_exit(moon_pos.longitude, moon_speed)
 
-    # Find closest applying aspect
-    applying_aspects: List[LunarAspect] = []
+    aspect_orbs = _aspect_orbs()
+    widest_orb = max(orb for _, _, orb in aspect_orbs)
+
+    # Soonest applying aspect so far: (time_to_exact, planet, aspect, orb)
+    best: Optional[Tuple[float, Planet, Aspect, float]] = None
 
     for planet, planet_pos in planets.items():
         if planet == Planet.MOON:
@@ -102,19 +156,19 @@ def calculate_moon_next_aspect(
         if separation > 180:
             separation = 360 - separation
 
-        # Check each aspect type
-        for aspect_type in Aspect:
-            orb_diff = abs(separation - aspect_type.degrees)
-            max_orb = aspect_type.orb
+        # Check each aspect type near the current separation
+        for aspect_type, degrees, max_orb in _candidate_aspects(
+            separation, aspect_orbs, widest_orb
+        ):
+            orb_diff = abs(separation - degrees)
 
             if orb_diff <= max_orb:
                 if is_moon_applying_to_aspect(
                     moon_pos, planet_pos, aspect_type, moon_speed
                 ):
-                    degrees_to_exact = orb_diff
                     relative_speed = moon_speed - planet_pos.speed
                     time_to_exact = (
-                        degrees_to_exact / abs(relative_speed)
+                        orb_diff / abs(relative_speed)
                         if relative_speed != 0
                         else float("inf")
                     )
@@ -126,25 +180,23 @@ def calculate_moon_next_aspect(
                     ):
                         continue
 
-                    applying_aspects.append(
-                        LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=degrees_to_exact,
-                            perfection_eta_days=time_to_exact,
-                            perfection_eta_description=format_timing_description(
-                                time_to_exact
-                            ),
-                            applying=True,
-                        )
-                    )
+                    if best is None or time_to_exact < best[0]:
+                        best = (time_to_exact, planet, aspect_type, orb_diff)
 
-    # Return soonest (smallest time_to_exact)
-    if applying_aspects:
-        return min(applying_aspects, key=lambda x: x.perfection_eta_days)
+    if best is None:
+        return None
 
-    return None
+    # Return soonest (smallest time_to_exact)
+    time_to_exact, planet, aspect_type, orb_diff = best
+    return LunarAspect(
+        planet=planet,
+        aspect=aspect_type,
+        orb=orb_diff,
+        degrees_difference=orb_diff,
+        perfection_eta_days=time_to_exact,
+        perfection_eta_description=format_timing_description(time_to_exact),
+        applying=True,
+    )
 
 
 def _moon_orb_motion(
@@ -190,82 +242,119 @@ def is_moon_applying_to_aspect(
     return _moon_orb_motion(moon_pos, planet_pos, aspect, moon_speed) < 0
 
 
+# Upper bounds (exclusive, in days) paired with the formatter for each band
+_TIMING_THRESHOLDS: Tuple[float, ...] = (0.5, 1, 7, 30, 365)
+_TIMING_FORMATTERS: Tuple[Callable[[float], str], ...] = (
+    lambda days: "Within hours",
+    lambda days: "Within a day",
+    lambda days: f"Within {int(days)} days",
+    lambda days: f"Within {int(days/7)} weeks",
+    lambda days: f"Within {int(days/30)} months",
+    lambda days: "More than a year",
+)
+
+
 def format_timing_description(days: float) -> str:
     """Format timing description for aspect perfection"""
-    if days < 0.5:
-        return "Within hours"
-    if days < 1:
-        return "Within a day"
-    if days < 7:
-        return f"Within {int(days)} days"
-    if days < 30:
-        return f"Within {int(days/7)} weeks"
-    if days < 365:
-        return f"Within {int(days/30)} months"
-    return "More than a year"
+    return _TIMING_FORMATTERS[bisect_right(_TIMING_THRESHOLDS, days)](days)
 
 
 def calculate_enhanced_aspects(
     planets: Dict[Planet, PlanetPosition], jd_ut: float
 ) -> List[AspectInfo]:
-    """Enhanced aspect calculation with configuration"""
+    """Enhanced aspect calculation with configuration.
+
+    Separations are computed once per planet pair and only aspects within the
+    pair's widest orb are tested; the tightest aspect within orb is kept.
+    """
     aspects: List[AspectInfo] = []
-    planet_list = list(planets.keys())
+    append = aspects.append
+    # Sign-exit days depend only on each planet, so compute them once per chart
+    entries = [
+        (planet, pos, pos.longitude, days_to_sign_exit(pos.longitude, pos.speed))
+        for planet, pos in planets.items()
+    ]
+    aspect_orbs = _aspect_orbs()
     config = cfg()
+    max_future_days = config.timing.max_future_days
+    sorted_degrees = _SORTED_DEGREES
+    pair_max_orbs = _pair_max_orbs
+    candidate_range = _candidate_range
+
+    for (planet1, pos1, lon1, exit1), (planet2, pos2, lon2, exit2) in combinations(
+        entries, 2
+    ):
+        # Calculate angular separation
+        angle_diff = abs(lon1 - lon2)
+        if angle_diff > 180:
+            angle_diff = 360 - angle_diff
+
+        # Orb from exact for aspects near the separation, masked by the
+        # pair's orb limits
+        max_orbs = pair_max_orbs(planet1, planet2, aspect_orbs, config)
+        in_orb: List[Tuple[float, int]] = []
+        for k in candidate_range(angle_diff, max(max_orbs)):
+            orb_diff = abs(angle_diff - sorted_degrees[k])
+            if orb_diff <= max_orbs[k]:
+                in_orb.append((orb_diff, k))
+        if not in_orb:
+            continue
 
-    for i, planet1 in enumerate(planet_list):
-        for planet2 in planet_list[i + 1 :]:
-            pos1 = planets[planet1]
-            pos2 = planets[planet2]
-
-            # Calculate angular separation
-            angle_diff = abs(pos1.longitude - pos2.longitude)
-            if angle_diff > 180:
-                angle_diff = 360 - angle_diff
-
-            # Check each traditional aspect
-            for aspect_type in Aspect:
-                orb_diff = abs(angle_diff - aspect_type.degrees)
-
-                # ENHANCED: Traditional moiety-based orb calculation
-                max_orb = calculate_moiety_based_orb(
-                    planet1, planet2, aspect_type, config
-                )
-
-                # Fallback to configured orbs if moiety system disabled
-                if max_orb == 0:
-                    max_orb = aspect_type.orb
-                    # Luminary bonuses (legacy)
-                    if Planet.SUN in [planet1, planet2]:
-                        max_orb += config.orbs.sun_orb_bonus
-                    if Planet.MOON in [planet1, planet2]:
-                        max_orb += config.orbs.moon_orb_bonus
-
-                if orb_diff <= max_orb:
-                    # Determine if applying
-                    applying = is_applying_enhanced(pos1, pos2, aspect_type, jd_ut)
-
-                    # Calculate degrees to exact and timing
-                    degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
-                        pos1, pos2, aspect_type, jd_ut
-                    )
-
-                    aspects.append(
-                        AspectInfo(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            applying=applying,
-                            exact_time=exact_time,
-                            degrees_to_exact=degrees_to_exact,
-                        )
-                    )
-                    break
+        # Tightest aspect wins; ties resolve to the earlier aspect type
+        orb_diff, k = min(in_orb)
+        aspect_type = aspect_orbs[k][0]
+
+        # Determine if applying
+        applying = is_applying_enhanced(
+            pos1, pos2, aspect_type, jd_ut, days_to_exit1=exit1, days_to_exit2=exit2
+        )
+
+        # Calculate degrees to exact and timing
+        degrees_to_exact, exact_time = calculate_enhanced_degrees_to_exact(
+            pos1, pos2, aspect_type, jd_ut, max_future_days=max_future_days
+        )
+
+        append(
+            AspectInfo(
+                planet1=planet1,
+                planet2=planet2,
+                aspect=aspect_type,
+                orb=orb_diff,
+                applying=applying,
+                exact_time=exact_time,
+                degrees_to_exact=degrees_to_exact,
+            )
+        )
 
     return aspects
 
 
+def _pair_max_orbs(
+    planet1: Planet,
+    planet2: Planet,
+    aspect_orbs: List[Tuple[Aspect, float, float]],
+    config,
+) -> List[float]:
+    """Return the maximum allowed orb for each aspect type between two planets."""
+
+    max_orbs: List[float] = []
+    for aspect_type, _, orb in aspect_orbs:
+        # ENHANCED: Traditional moiety-based orb calculation
+        max_orb = calculate_moiety_based_orb(planet1, planet2, aspect_type, config)
+
+        # Fallback to configured orbs if moiety system disabled
+        if max_orb == 0:
+            max_orb = orb
+            # Luminary bonuses (legacy)
+            if Planet.SUN in [planet1, planet2]:
+                max_orb += config.orbs.sun_orb_bonus
+            if Planet.MOON in [planet1, planet2]:
+                max_orb += config.orbs.moon_orb_bonus
+
+        max_orbs.append(max_orb)
+    return max_orbs
+
+
 def calculate_moiety_based_orb(
     planet1: Planet, planet2: Planet, aspect_type: Aspect, config
 ) -> float:
@@ -295,20 +384,35 @@ def calculate_moiety_based_orb(
 
 
 def is_applying_enhanced(
-    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, jd_ut: float
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    jd_ut: float,
+    days_to_exit1: Optional[float] = None,
+    days_to_exit2: Optional[float] = None,
 ) -> bool:
-    """Determine if planets are applying to a given aspect analytically."""
+    """Determine if planets are applying to a given aspect analytically.
+
+    ``days_to_exit1``/``days_to_exit2`` may be supplied by callers that have
+    already computed each planet's days to sign exit.
+    """
 
     # Signed difference from exact aspect in range [-180, 180)
     diff = (pos1.longitude - pos2.longitude - aspect.degrees + 180) % 360 - 180
     current_orb = abs(diff)
 
+    if days_to_exit1 is None:
+        days_to_exit1 = days_to_sign_exit(pos1.longitude, pos1.speed)
+    if days_to_exit2 is None:
+        days_to_exit2 = days_to_sign_exit(pos2.longitude, pos2.speed)
+
     # Check sign exit conditions (preserve traditional horary rules)
-    if not _will_perfect_before_sign_exit(pos1, pos2, aspect, current_orb):
+    if not _will_perfect_before_sign_exit(
+        pos1, pos2, current_orb, days_to_exit1, days_to_exit2
+    ):
         return False
 
-    relative_speed = pos1.speed - pos2.speed
-    return diff * relative_speed < 0
+    return diff * (pos1.speed - pos2.speed) < 0
 
 
 def _calculate_orb_to_aspect(pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect) -> float:
@@ -352,8 +456,13 @@ def _calculate_orb_to_aspect_at_time(pos1: PlanetPosition, pos2: PlanetPosition,
     return future_orb
 
 
-def _will_perfect_before_sign_exit(pos1: PlanetPosition, pos2: PlanetPosition, 
-                                 aspect: Aspect, current_orb: float) -> bool:
+def _will_perfect_before_sign_exit(
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    current_orb: float,
+    pos1_days_to_exit: Optional[float],
+    pos2_days_to_exit: Optional[float],
+) -> bool:
     """Check if aspect will perfect before either planet exits its current sign"""
     
     # Calculate relative speed
@@ -364,10 +473,6 @@ def _will_perfect_before_sign_exit(pos1: PlanetPosition, pos2: PlanetPosition,
     # Estimate days to perfection
     days_to_perfect = current_orb / relative_speed
     
-    # Check days until each planet exits its current sign
-    pos1_days_to_exit = days_to_sign_exit(pos1.longitude, pos1.speed)
-    pos2_days_to_exit = days_to_sign_exit(pos2.longitude, pos2.speed)
-    
     # If either planet exits sign before perfection, aspect won't perfect
     if pos1_days_to_exit and days_to_perfect > pos1_days_to_exit:
         return False
@@ -378,9 +483,17 @@ def _will_perfect_before_sign_exit(pos1: PlanetPosition, pos2: PlanetPosition,
 
 
 def calculate_enhanced_degrees_to_exact(
-    pos1: PlanetPosition, pos2: PlanetPosition, aspect: Aspect, jd_ut: float
+    pos1: PlanetPosition,
+    pos2: PlanetPosition,
+    aspect: Aspect,
+    jd_ut: float,
+    max_future_days: Optional[float] = None,
 ) -> Tuple[float, Optional[datetime.datetime]]:
-    """Enhanced degrees and time calculation"""
+    """Enhanced degrees and time calculation.
+
+    ``max_future_days`` may be supplied by callers that already hold the
+    configuration; otherwise it is read from ``cfg()``.
+    """
 
     # Current separation
     separation = abs(pos1.longitude - pos2.longitude)
@@ -395,15 +508,11 @@ def calculate_enhanced_degrees_to_exact(
     if abs(pos1.speed - pos2.speed) > 0:
         days_to_exact = orb_from_exact / abs(pos1.speed - pos2.speed)
 
-        max_future_days = cfg().timing.max_future_days
+        if max_future_days is None:
+            max_future_days = cfg().timing.max_future_days
         if days_to_exact < max_future_days:
             try:
-                exact_jd = jd_ut + days_to_exact
-                # Convert back to datetime
-                year, month, day, hour = swe.jdut1_to_utc(exact_jd, 1)  # Flag 1 for Gregorian
-                exact_time = datetime.datetime(
-                    int(year), int(month), int(day), int(hour), int((hour % 1) * 60)
-                )
+                exact_time = _jd_to_datetime(round(jd_ut + days_to_exact, 6))
             except Exception:
                 exact_time = None
 
@@ -412,3 +521,18 @@ def calculate_enhanced_degrees_to_exact(
         return 0.1, exact_time
 
     return orb_from_exact, exact_time
+
+
+@lru_cache(maxsize=1024)
+def _jd_to_datetime(jd: float) -> datetime.datetime:
+    """Convert a Julian Day (UT) to a naive UTC ``datetime``.
+
+    Results are memoized because many aspect pairs in one chart resolve to
+    the same (rounded) exact moment.
+    """
+
+    # Flag 1 for Gregorian; returns (year, month, day, hour, minute, seconds)
+    year, month, day, hour, minute, seconds = _jdut1_to_utc(jd, 1)
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute)
+    ) + datetime.timedelta(seconds=seconds)
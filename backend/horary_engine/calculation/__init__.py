@@ -1,6 +1,7 @@
 """Mathematical and chart calculation utilities."""
 
 from .helpers import (
+    calc_planet_ut,
     calculate_next_station_time,
     calculate_future_longitude,
     calculate_sign_boundary_longitude,
@@ -15,6 +16,7 @@ from .helpers import (
 )
 
 __all__ = [
+    "calc_planet_ut",
     "calculate_next_station_time",
     "calculate_future_longitude",
     "calculate_sign_boundary_longitude",
@@ -15,9 +15,33 @@ Created for computational functions used in horary judgment
 
 import math
 import datetime
+from functools import lru_cache
 from typing import Tuple, Optional, Dict, Any
 import swisseph as swe
 
+# Swiss Ephemeris positions with daily speeds
+_SWE_FLAGS = swe.FLG_SWIEPH | swe.FLG_SPEED
+
+
+@lru_cache(maxsize=256)
+def calc_planet_ut(jd_ut: float, planet_id: int) -> Tuple[float, ...]:
+    """
+    Swiss Ephemeris position (with speed) for a planet, memoized by Julian Day.
+
+    Chart calculation asks for the same body at the same moment several times
+    (e.g. the Moon for its position, speed and lunar aspects), so results are
+    cached to avoid repeated ephemeris calls.
+
+    Args:
+        jd_ut: Julian Day (UT)
+        planet_id: Swiss Ephemeris planet ID
+
+    Returns:
+        (longitude, latitude, distance, lon_speed, lat_speed, dist_speed)
+    """
+    planet_data, _ = swe.calc_ut(jd_ut, planet_id, _SWE_FLAGS)
+    return tuple(planet_data)
+
 
 def calculate_next_station_time(planet_id: int, jd_start: float, 
                                max_days: int = 365) -> Optional[float]:
@@ -39,7 +63,7 @@ def calculate_next_station_time(planet_id: int, jd_start: float,
     
     try:
         # Get initial speed
-        initial_data, _ = swe.calc_ut(jd_start, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        initial_data, _ = swe.calc_ut(jd_start, planet_id, _SWE_FLAGS)
         initial_speed = initial_data[3]
         
         # Search forward in time
@@ -50,7 +74,7 @@ def calculate_next_station_time(planet_id: int, jd_start: float,
         
         while current_jd < max_jd:
             try:
-                planet_data, _ = swe.calc_ut(current_jd, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+                planet_data, _ = swe.calc_ut(current_jd, planet_id, _SWE_FLAGS)
                 current_speed = planet_data[3]
                 
                 # Check for sign change in speed (station)
@@ -80,8 +104,8 @@ def _refine_station_time(planet_id: int, jd_before: float, jd_after: float) -> f
         jd_mid = (jd_before + jd_after) / 2
         
         try:
-            data_before, _ = swe.calc_ut(jd_before, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            data_mid, _ = swe.calc_ut(jd_mid, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            data_before, _ = swe.calc_ut(jd_before, planet_id, _SWE_FLAGS)
+            data_mid, _ = swe.calc_ut(jd_mid, planet_id, _SWE_FLAGS)
             
             speed_before = data_before[3]
             speed_mid = data_mid[3]
@@ -202,8 +226,8 @@ def calculate_elongation(planet_longitude: float, sun_longitude: float) -> float
     
     Classical source: Ptolemy Almagest - planetary visibility calculations
     """
-    diff = abs(planet_longitude - sun_longitude)
-    return min(diff, 360 - diff)
+    # Shortest arc via modular difference folded about 180°
+    return 180.0 - abs((planet_longitude - sun_longitude) % 360.0 - 180.0)
 
 
 def is_planet_oriental(planet_longitude: float, sun_longitude: float) -> bool:
@@ -283,7 +307,7 @@ def calculate_moon_variable_speed(jd_ut: float) -> float:
     Classical source: Lilly III Chap. XXV - Moon's variable motion in timing
     """
     try:
-        moon_data, _ = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        moon_data = calc_planet_ut(jd_ut, swe.MOON)
         return abs(moon_data[3])  # Return absolute speed
     except Exception:
         return 13.0  # Classical average fallback
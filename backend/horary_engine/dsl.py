@@ -16,7 +16,7 @@ except ImportError:  # pragma: no cover - fallback when executed as script
 # ---------------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Role:
     """Simple identifier for a significator role."""
 
@@ -39,7 +39,7 @@ Actor = Union[Planet, Role]
 # ---------------------------------------------------------------------------
 
 
-@dataclass
+@dataclass(slots=True)
 class Aspect:
     """Relationship between two actors."""
 
@@ -53,7 +53,7 @@ def aspect(actor1: Actor, actor2: Actor, aspect: AspectType, applying: bool = Tr
     return Aspect(actor1, actor2, aspect, applying)
 
 
-@dataclass
+@dataclass(slots=True)
 class Translation:
     """Translation of light through a third actor."""
 
@@ -66,7 +66,7 @@ def translation(translator: Actor, from_actor: Actor, to_actor: Actor) -> Transl
     return Translation(translator, from_actor, to_actor)
 
 
-@dataclass
+@dataclass(slots=True)
 class Collection:
     """Collection of light by a slower actor."""
 
@@ -79,7 +79,7 @@ def collection(collector: Actor, actor1: Actor, actor2: Actor) -> Collection:
     return Collection(collector, actor1, actor2)
 
 
-@dataclass
+@dataclass(slots=True)
 class Prohibition:
     """Interfering aspect preventing perfection."""
 
@@ -92,7 +92,7 @@ def prohibition(prohibitor: Actor, significator: Actor, aspect: Optional[AspectT
     return Prohibition(prohibitor, significator, aspect)
 
 
-@dataclass
+@dataclass(slots=True)
 class Refranation:
     """One actor refrains from completing an aspect."""
 
@@ -104,7 +104,7 @@ def refranation(refrainer: Actor, other: Actor) -> Refranation:
     return Refranation(refrainer, other)
 
 
-@dataclass
+@dataclass(slots=True)
 class Frustration:
     """Third actor perfects aspect before main significators."""
 
@@ -117,7 +117,7 @@ def frustration(frustrator: Actor, from_actor: Actor, to_actor: Actor) -> Frustr
     return Frustration(frustrator, from_actor, to_actor)
 
 
-@dataclass
+@dataclass(slots=True)
 class Abscission:
     """Cutting off a connection between actors."""
 
@@ -130,7 +130,7 @@ def abscission(abscissor: Actor, from_actor: Actor, to_actor: Actor) -> Abscissi
     return Abscission(abscissor, from_actor, to_actor)
 
 
-@dataclass
+@dataclass(slots=True)
 class Reception:
     """One actor receives another in dignity."""
 
@@ -143,7 +143,7 @@ def reception(receiver: Actor, received: Actor, dignity: str) -> Reception:
     return Reception(receiver, received, dignity)
 
 
-@dataclass
+@dataclass(slots=True)
 class EssentialDignity:
     """Essential dignity indicator for an actor.
 
@@ -162,7 +162,7 @@ def essential(actor: Actor, score: Union[float, str]) -> EssentialDignity:
     return EssentialDignity(actor, score)
 
 
-@dataclass
+@dataclass(slots=True)
 class AccidentalDignity:
     """Accidental dignity indicator for an actor.
 
@@ -178,7 +178,7 @@ def accidental(actor: Actor, score: Union[float, str]) -> AccidentalDignity:
     return AccidentalDignity(actor, score)
 
 
-@dataclass
+@dataclass(slots=True)
 class MoonVoidOfCourse:
     """Status of the Moon's void-of-course condition."""
 
@@ -190,7 +190,7 @@ def moon_voc(is_voc: bool, detail: Optional[str] = None) -> MoonVoidOfCourse:
     return MoonVoidOfCourse(is_voc, detail)
 
 
-@dataclass
+@dataclass(slots=True)
 class HousePlacement:
     """Placement of an actor within a house."""
 
@@ -214,7 +214,7 @@ def is_malefic(planet: Planet) -> bool:
     return planet in (Planet.MARS, Planet.SATURN)
 
 
-@dataclass
+@dataclass(slots=True)
 class RoleImportance:
     """Importance weighting for a role."""
 
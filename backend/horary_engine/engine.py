@@ -10,11 +10,17 @@ Refactored with comprehensive configuration system and enhanced lunar calculatio
 """
 
 import os
+import dataclasses
 import datetime
 import logging
 import re
 import math
-from typing import Dict, List, Optional, Any, Tuple
+import pickle
+from bisect import bisect_right
+from collections import OrderedDict
+from itertools import accumulate
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Literal, Optional, Any, Tuple
 from types import SimpleNamespace
 
 # Configuration system
@@ -25,6 +31,7 @@ import swisseph as swe
 
 # Import our computational helpers
 from .calculation.helpers import (
+    calc_planet_ut,
     calculate_next_station_time,
     calculate_future_longitude,
     calculate_sign_boundary_longitude,
@@ -63,6 +70,10 @@ from .dsl import (
 # Setup module logger
 logger = logging.getLogger(__name__)
 
+# Reasoning entry patterns: "Stage: rule" and a trailing "(+N)" / "N%" weight
+_STAGE_RE = re.compile(r"\s*([^:]+):\s*(.*)")
+_WEIGHT_RE = re.compile(r"\s*(?:\(([+-]?\d+)%?\)|([+-]?\d+)%)\s*$")
+
 
 def _structure_reasoning(reasoning: List[Any]) -> List[Dict[str, Any]]:
     """Normalize reasoning entries into structured objects.
@@ -84,8 +95,19 @@ def _structure_reasoning(reasoning: List[Any]) -> List[Dict[str, Any]]:
         Structured reasoning entries.
     """
 
+    # Fast path: already-structured entries need no pattern matching
+    if reasoning and all(isinstance(entry, dict) for entry in reasoning):
+        return [
+            {
+                "stage": entry.get("stage", "General"),
+                "rule": entry.get("rule", entry.get("reason", "")),
+                "weight": entry.get("weight", entry.get("delta", 0)),
+            }
+            for entry in reasoning
+        ]
+
     structured: List[Dict[str, Any]] = []
-    config = None  # lazily loaded configuration for weight lookups
+    asc_penalty = None  # lazily loaded radicality penalty for weight lookups
     for entry in reasoning:
         if isinstance(entry, dict):
             structured.append(
@@ -102,12 +124,12 @@ def _structure_reasoning(reasoning: List[Any]) -> List[Dict[str, Any]]:
         rule = text
         weight = 0
 
-        stage_match = re.match(r"\s*([^:]+):\s*(.*)", text)
+        stage_match = _STAGE_RE.match(text)
         if stage_match:
             stage = stage_match.group(1).strip()
             rule = stage_match.group(2).strip()
 
-        weight_match = re.search(r"\s*(?:\(([+-]?\d+)%?\)|([+-]?\d+)%)\s*$", rule)
+        weight_match = _WEIGHT_RE.search(rule)
         if weight_match:
             weight_str = weight_match.group(1) or weight_match.group(2)
             try:
@@ -121,22 +143,22 @@ def _structure_reasoning(reasoning: List[Any]) -> List[Dict[str, Any]]:
                 "Ascendant too early" in rule or "Ascendant too late" in rule
             ):
                 # Load configuration lazily to avoid startup cost when unused
-                if config is None:
+                if asc_penalty is None:
                     try:
                         config = cfg()
                     except Exception:
                         config = SimpleNamespace()
-                penalty = getattr(
-                    getattr(config, "radicality", SimpleNamespace()),
-                    "asc_warning_penalty",
-                    0,
-                )
-                try:
-                    penalty_int = int(penalty)
-                except (TypeError, ValueError):
-                    penalty_int = 0
-                if penalty_int:
-                    weight = -penalty_int
+                    penalty = getattr(
+                        getattr(config, "radicality", SimpleNamespace()),
+                        "asc_warning_penalty",
+                        0,
+                    )
+                    try:
+                        asc_penalty = int(penalty)
+                    except (TypeError, ValueError):
+                        asc_penalty = 0
+                if asc_penalty:
+                    weight = -asc_penalty
                     rule = f"{rule} ({weight})"
 
         structured.append({"stage": stage, "rule": rule, "weight": weight})
@@ -144,6 +166,48 @@ def _structure_reasoning(reasoning: List[Any]) -> List[Dict[str, Any]]:
     return structured
 
 
+# Target angles of the major aspects, in degrees
+_ASPECT_TARGET_DEG: Dict[Aspect, float] = {aspect: float(aspect.degrees) for aspect in Aspect}
+_FUTURE_ASPECT_ANGLES: Tuple[float, ...] = tuple(_ASPECT_TARGET_DEG.values())
+
+
+def _calc_future_aspect_time(
+    p1: PlanetPosition,
+    p2: PlanetPosition,
+    aspect: Aspect,
+    jd_start: float = 0.0,
+    max_days: float = 0.0,
+) -> float:
+    """Days until ``p1`` and ``p2`` form ``aspect`` at current speeds."""
+
+    rel_speed = p1.speed - p2.speed
+    if rel_speed == 0:
+        return float("inf")
+    delta = (p2.longitude + _ASPECT_TARGET_DEG[aspect] - p1.longitude) % 360.0
+    return delta / rel_speed
+
+
+def _soonest_future_aspect_days(
+    p1: PlanetPosition, p2: PlanetPosition
+) -> Optional[float]:
+    """Days until the nearest future major aspect between two planets.
+
+    All aspect angles are swept in one pass over shared longitude and speed
+    values; returns ``None`` when no aspect lies ahead.
+    """
+
+    rel_speed = p1.speed - p2.speed
+    if rel_speed == 0:
+        return None
+    offset = p2.longitude - p1.longitude
+    soonest: Optional[float] = None
+    for angle in _FUTURE_ASPECT_ANGLES:
+        t = ((offset + angle) % 360.0) / rel_speed
+        if t > 0 and (soonest is None or t < soonest):
+            soonest = t
+    return soonest
+
+
 def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List[Any]:
     """Extract DSL primitives from a chart using significator contract.
 
@@ -167,20 +231,16 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
 
     primitives: List[Any] = []
 
-    def resolve_actor(planet: Planet):
-        """Map planets to DSL actors based on the provided contract."""
-
-        if contract.get("querent") == planet:
-            return L1
-        if contract.get("quesited") == planet:
-            return LQ
-        if planet == Planet.MOON:
-            return MoonRole
-        # Any additional role provided in contract
-        for role_name, role_planet in (contract or {}).items():
-            if role_planet == planet:
-                return DslRole(role_name)
-        return planet
+    # Map planets to DSL actors based on the provided contract. Precedence:
+    # querent, quesited, the Moon, then the first additional role listed.
+    actor_by_planet: Dict[Any, Any] = {}
+    for role_name, role_planet in (contract or {}).items():
+        actor_by_planet.setdefault(role_planet, DslRole(role_name))
+    actor_by_planet[Planet.MOON] = MoonRole
+    if (contract or {}).get("quesited") is not None:
+        actor_by_planet[contract["quesited"]] = LQ
+    if (contract or {}).get("querent") is not None:
+        actor_by_planet[contract["querent"]] = L1
 
     # ------------------------------------------------------------------
     # Aspects
@@ -188,8 +248,8 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
     for asp in getattr(chart, "aspects", []):
         primitives.append(
             dsl_aspect(
-                resolve_actor(asp.planet1),
-                resolve_actor(asp.planet2),
+                actor_by_planet.get(asp.planet1, asp.planet1),
+                actor_by_planet.get(asp.planet2, asp.planet2),
                 asp.aspect,
                 applying=asp.applying,
             )
@@ -198,14 +258,16 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
     # ------------------------------------------------------------------
     # Dignity states (essential)
     # ------------------------------------------------------------------
+    append = primitives.append
     for planet, pos in getattr(chart, "planets", {}).items():
-        actor = resolve_actor(planet)
-        primitives.append(dsl_essential(actor, float(pos.dignity_score)))
+        actor = actor_by_planet.get(planet, planet)
+        score = pos.dignity_score
+        append(dsl_essential(actor, float(score)))
         # Emit qualitative debility tokens for downstream rule weighting
-        if pos.dignity_score <= -5:
-            primitives.append(dsl_essential(actor, "detriment"))
+        if score <= -5:
+            append(dsl_essential(actor, "detriment"))
         if pos.retrograde:
-            primitives.append(dsl_accidental(actor, "retro"))
+            append(dsl_accidental(actor, "retro"))
 
     # ------------------------------------------------------------------
     # Translation, collection & prohibition
@@ -216,40 +278,8 @@ def extract_testimonies(chart: HoraryChart, contract: Dict[str, Planet]) -> List
         pos1 = chart.planets[sig1]
         pos2 = chart.planets[sig2]
 
-        def _calc_future_aspect_time(
-            p1: PlanetPosition,
-            p2: PlanetPosition,
-            aspect: Aspect,
-            jd_start: float = 0.0,
-            max_days: float = 0.0,
-        ) -> float:
-            target_angles = {
-                Aspect.CONJUNCTION: 0,
-                Aspect.SEXTILE: 60,
-                Aspect.SQUARE: 90,
-                Aspect.TRINE: 120,
-                Aspect.OPPOSITION: 180,
-            }
-            rel_speed = p1.speed - p2.speed
-            if rel_speed == 0:
-                return float("inf")
-            delta = (p2.longitude + target_angles[aspect] - p1.longitude) % 360.0
-            return delta / rel_speed
-
-        aspect_types = [
-            Aspect.CONJUNCTION,
-            Aspect.SEXTILE,
-            Aspect.SQUARE,
-            Aspect.TRINE,
-            Aspect.OPPOSITION,
-        ]
-        times: List[float] = []
-        for a in aspect_types:
-            t = _calc_future_aspect_time(pos1, pos2, a)
-            if t and t > 0:
-                times.append(t)
-        if times:
-            days_ahead = min(times)
+        days_ahead = _soonest_future_aspect_days(pos1, pos2)
+        if days_ahead is not None:
             result = check_future_prohibitions(
                 chart, sig1, sig2, days_ahead, _calc_future_aspect_time
             )
@@ -322,8 +352,184 @@ from .serialization import (
 from .perfection import check_future_prohibitions
 
 
+# Detriment - signs opposite to each planet's rulerships
+_DETRIMENT_SIGNS: Dict[Planet, frozenset] = {
+    Planet.SUN: frozenset({Sign.AQUARIUS}),
+    Planet.MOON: frozenset({Sign.CAPRICORN}),
+    Planet.MERCURY: frozenset({Sign.PISCES, Sign.SAGITTARIUS}),
+    Planet.VENUS: frozenset({Sign.ARIES, Sign.SCORPIO}),
+    Planet.MARS: frozenset({Sign.LIBRA, Sign.TAURUS}),
+    Planet.JUPITER: frozenset({Sign.GEMINI, Sign.VIRGO}),
+    Planet.SATURN: frozenset({Sign.CANCER, Sign.LEO}),
+}
+
+# Traditional house joys
+_HOUSE_JOYS: Dict[Planet, int] = {
+    Planet.MERCURY: 1,  # 1st house
+    Planet.MOON: 3,     # 3rd house
+    Planet.VENUS: 5,    # 5th house
+    Planet.MARS: 6,     # 6th house
+    Planet.SUN: 9,      # 9th house
+    Planet.JUPITER: 11, # 11th house
+    Planet.SATURN: 12,  # 12th house
+}
+
+_EMPTY_SIGNS: frozenset = frozenset()
+
+# Traditional triplicity rulers by sign as (day, night)
+_TRIPLICITY_RULERS: Dict[Sign, Tuple[Planet, Planet]] = {
+    # Fire signs (Aries, Leo, Sagittarius)
+    Sign.ARIES: (Planet.SUN, Planet.JUPITER),
+    Sign.LEO: (Planet.SUN, Planet.JUPITER),
+    Sign.SAGITTARIUS: (Planet.SUN, Planet.JUPITER),
+    # Earth signs (Taurus, Virgo, Capricorn)
+    Sign.TAURUS: (Planet.VENUS, Planet.MOON),
+    Sign.VIRGO: (Planet.VENUS, Planet.MOON),
+    Sign.CAPRICORN: (Planet.VENUS, Planet.MOON),
+    # Air signs (Gemini, Libra, Aquarius)
+    Sign.GEMINI: (Planet.SATURN, Planet.MERCURY),
+    Sign.LIBRA: (Planet.SATURN, Planet.MERCURY),
+    Sign.AQUARIUS: (Planet.SATURN, Planet.MERCURY),
+    # Water signs (Cancer, Scorpio, Pisces)
+    Sign.CANCER: (Planet.VENUS, Planet.MARS),
+    Sign.SCORPIO: (Planet.VENUS, Planet.MARS),
+    Sign.PISCES: (Planet.VENUS, Planet.MARS),
+}
+
+# Traditional sect assignments: +1 diurnal, -1 nocturnal (Mercury is neutral)
+_SECT_SIGN: Dict[Planet, int] = {
+    Planet.SUN: 1,
+    Planet.JUPITER: 1,
+    Planet.SATURN: 1,
+    Planet.MOON: -1,
+    Planet.VENUS: -1,
+    Planet.MARS: -1,
+}
+
+# Speed classes for dignity bonuses
+_INFERIOR_PLANETS = frozenset({Planet.MERCURY, Planet.VENUS})
+_SUPERIOR_PLANETS = frozenset({Planet.MARS, Planet.JUPITER, Planet.SATURN})
+
+# House class by house number: 0 = unplaced, 1 = angular, 2 = succedent,
+# 3 = cadent
+_HOUSE_CLASS_INDEX: Tuple[int, ...] = (0,) + (1, 2, 3) * 4
+_HOUSE_CLASS_NAMES: Tuple[str, ...] = ("cadent", "angular", "succedent", "cadent")
+
+# House-number bitmasks for angular (1, 4, 7, 10) and succedent (2, 5, 8, 11)
+_ANGULAR_MASK = (1 << 1) | (1 << 4) | (1 << 7) | (1 << 10)
+_SUCCEDENT_MASK = (1 << 2) | (1 << 5) | (1 << 8) | (1 << 11)
+# Houses 1, 2, 7, 8, 10 and 11: Moon rulerships relevant to financial/approval questions
+_MOON_ROLE_MASK = (1 << 1) | (1 << 2) | (1 << 7) | (1 << 8) | (1 << 10) | (1 << 11)
+
+# Moon phase buckets by Sun-Moon elongation: lower edges of each phase after
+# New Moon, with matching display names and ``moon.phase_bonus`` config keys
+_MOON_PHASE_EDGES: Tuple[float, ...] = (30, 60, 120, 150, 210, 240, 300)
+_MOON_PHASE_NAMES: Tuple[str, ...] = (
+    "New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+    "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent",
+)
+_MOON_PHASE_KEYS: Tuple[str, ...] = (
+    "new_moon", "waxing_crescent", "first_quarter", "waxing_gibbous",
+    "full_moon", "waning_gibbous", "last_quarter", "waning_crescent",
+)
+
+# Moon speed buckets (degrees/day): upper bounds, display names and
+# ``moon.speed_bonus`` config keys
+_MOON_SPEED_EDGES: Tuple[float, ...] = (11.0, 12.0, 14.0, 15.0)
+_MOON_SPEED_NAMES: Tuple[str, ...] = ("Very Slow", "Slow", "Average", "Fast", "Very Fast")
+_MOON_SPEED_KEYS: Tuple[str, ...] = ("very_slow", "slow", "average", "fast", "very_fast")
+
+# Combustion bands for significators by distance from the Sun: upper edges
+# (exclusive), confidence penalties and reasoning labels
+_COMBUSTION_EDGES: Tuple[float, ...] = (1.0, 2.0, 5.0)
+_COMBUSTION_PENALTIES: Tuple[int, ...] = (40, 25, 15, 10)
+_COMBUSTION_LABELS: Tuple[str, ...] = (
+    "extreme combustion", "severe combustion", "combustion", "light combustion"
+)
+_SOLAR_IMPEDIMENTS = frozenset({SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS})
+# Their names as reported in serialized solar_factors["detailed_analyses"]
+_SOLAR_IMPEDIMENT_NAMES = frozenset(condition.condition_name for condition in _SOLAR_IMPEDIMENTS)
+
+# Aspect kinds by nature; conjunction belongs to neither
+_HARD_ASPECTS = frozenset({Aspect.SQUARE, Aspect.OPPOSITION})
+_SOFT_ASPECTS = frozenset({Aspect.TRINE, Aspect.SEXTILE})
+# Hard aspect values as recorded in benefic support entries
+_HARD_ASPECT_VALUES = frozenset(aspect.value for aspect in _HARD_ASPECTS)
+
+# Traditional moieties (half-orbs) in degrees for the moiety orb check
+_TRADITIONAL_MOIETIES: Dict[Planet, float] = {
+    Planet.SUN: 17.0,
+    Planet.MOON: 12.5,
+    Planet.MERCURY: 7.0,
+    Planet.VENUS: 8.0,
+    Planet.MARS: 7.5,
+    Planet.JUPITER: 9.0,
+    Planet.SATURN: 9.5,
+}
+
+def _severe_solar_impediments(analysis: Optional[SolarAnalysis], dignity: int) -> int:
+    """Severe solar impediments of one significator for the R17b denial
+    
+    Combustion within 1° of the Sun counts once; combustion within 3° while
+    at dignity -4 or worse counts again.
+    """
+    if analysis is None or analysis.condition is not SolarCondition.COMBUSTION:
+        return 0
+    distance = round(analysis.distance_from_sun, 4)  # as reported in solar_factors
+    return (distance < _COMBUSTION_EDGES[0]) + (dignity <= -4 and distance < 3.0)
+
+# Significator dignity bands for confidence: (delta, floor, ceiling, reasoning),
+# indexed by how many band edges the dignity clears (see the adjustment below)
+_QUESITED_DIGNITY_BANDS: Tuple[Tuple[int, float, float, Optional[str]], ...] = (
+    (-35, 10, math.inf, "Severely weak quesited ({}): -35%"),
+    (-20, 25, math.inf, "Weak quesited dignity ({}): -20%"),
+    (0, -math.inf, math.inf, None),
+    (15, -math.inf, 95, "Strong quesited dignity ({}): +15%"),
+)
+_QUERENT_DIGNITY_BANDS: Tuple[Tuple[int, float, float, Optional[str]], ...] = (
+    (-15, 5, math.inf, "Weak querent dignity ({}): -15%"),
+    (0, -math.inf, math.inf, None),
+    (10, -math.inf, 95, "Strong querent dignity ({}): +10%"),
+)
+
+
+# Lunar mansions per degree of longitude (28 equal mansions of 12°51')
+_MANSION_SCALE = 28.0 / 360.0
+
+# Signs in zodiacal order, indexed by ``int(longitude // 30)``
+_SIGN_BY_INDEX: Tuple[Sign, ...] = tuple(sorted(Sign, key=lambda s: s.start_degree))
+
+# Sign and ruler for each whole degree, indexed by ``int(longitude % 360.0)``.
+# The trailing Pisces entry covers ``x % 360.0 == 360.0`` for tiny negative x.
+_SIGN_BY_DEGREE: Tuple[Sign, ...] = tuple(
+    _SIGN_BY_INDEX[degree // 30] for degree in range(360)
+) + (_SIGN_BY_INDEX[-1],)
+_RULER_BY_DEGREE: Tuple[Planet, ...] = tuple(sign.ruler for sign in _SIGN_BY_DEGREE)
+
+
+def _build_hour_ruler_table(
+    sequence: List[Planet], day_rulers: Dict[int, Planet]
+) -> Tuple[Tuple[Planet, ...], ...]:
+    """Planetary hour rulers indexed by ``[weekday][clock_hour]``"""
+    table = []
+    for weekday in range(7):
+        start_idx = sequence.index(day_rulers.get(weekday, Planet.SUN))
+        table.append(tuple(sequence[(start_idx + hour) % 7] for hour in range(24)))
+    return tuple(table)
+
+
 class EnhancedTraditionalAstrologicalCalculator:
-    """Enhanced Traditional astrological calculations with configuration system"""
+    """Enhanced Traditional astrological calculations with configuration system
+    
+    Recently calculated charts and the sect dignity tables are cached together
+    with the configuration object they were built from and reused while
+    ``cfg()`` returns that same object. Changing configuration values in place is not detected: call
+    ``HoraryConfig.reset()`` (or ``load_test_config``) so a new configuration
+    is loaded, or use a fresh calculator.
+    """
+    
+    # Maximum number of charts memoized by (jd_ut, lat, lon)
+    CHART_CACHE_SIZE = 128
     
     def __init__(self, timezone_manager=None):
         # Set Swiss Ephemeris path
@@ -332,6 +538,12 @@ class EnhancedTraditionalAstrologicalCalculator:
         # Initialize timezone manager (use provided or create new)
         self.timezone_manager = timezone_manager or TimezoneManager()
         
+        # Recently calculated charts, pickled, with the configuration they were built from
+        self._chart_cache: "OrderedDict[Tuple[float, float, float], Tuple[Any, bytes]]" = OrderedDict()
+        
+        # Sign/sect dignity tables per day-night flag, with their configuration
+        self._dignity_tables: Dict[bool, Tuple[Any, Dict[Tuple[Planet, Sign], int]]] = {}
+        
         # Traditional planets only
         self.planets_swe = {
             Planet.SUN: swe.SUN,
@@ -374,7 +586,7 @@ class EnhancedTraditionalAstrologicalCalculator:
     def get_real_moon_speed(self, jd_ut: float) -> float:
         """Get actual Moon speed from ephemeris in degrees per day"""
         try:
-            moon_data, ret_flag = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+            moon_data = calc_planet_ut(jd_ut, swe.MOON)
             return abs(moon_data[3])  # degrees per day
         except Exception as e:
             logger.warning(f"Failed to get Moon speed from ephemeris: {e}")
@@ -389,6 +601,23 @@ class EnhancedTraditionalAstrologicalCalculator:
         jd_ut = swe.julday(dt_utc.year, dt_utc.month, dt_utc.day, 
                           dt_utc.hour + dt_utc.minute/60.0 + dt_utc.second/3600.0)
         
+        # Reuse a chart for the same moment and place if the configuration
+        # it was scored with is still current
+        config = cfg()
+        cache_key = (round(jd_ut, 9), round(lat, 6), round(lon, 6))
+        cached = self._chart_cache.get(cache_key)
+        if cached is not None and cached[0] is config:
+            self._chart_cache.move_to_end(cache_key)
+            logger.debug(f"Using cached chart for Julian Day {jd_ut}")
+            return dataclasses.replace(
+                pickle.loads(cached[1]),
+                date_time=dt_local,
+                date_time_utc=dt_utc,
+                timezone_info=timezone_info,
+                location=(lat, lon),
+                location_name=location_name,
+            )
+        
         logger.info(f"Calculating chart for:")
         logger.info(f"  Local time: {dt_local} ({timezone_info})")
         logger.info(f"  UTC time: {dt_utc}")
@@ -404,23 +633,19 @@ class EnhancedTraditionalAstrologicalCalculator:
         planets = {}
         for planet_enum, planet_id in self.planets_swe.items():
             try:
-                planet_data, ret_flag = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                
-                longitude = planet_data[0]
-                latitude = planet_data[1]
-                speed = planet_data[3]  # degrees/day
-                retrograde = speed < 0
-                
-                sign = self._get_sign(longitude)
+                # Speed is in degrees/day; negative speed means retrograde
+                longitude, latitude, _, speed = calc_planet_ut(jd_ut, planet_id)[:4]
+                # Normalized once here so helpers can index and compare directly
+                longitude %= 360.0
                 
                 planets[planet_enum] = PlanetPosition(
                     planet=planet_enum,
                     longitude=longitude,
                     latitude=latitude,
                     house=0,  # Will be calculated after houses
-                    sign=sign,
+                    sign=_SIGN_BY_DEGREE[int(longitude)],
                     dignity_score=0,  # Will be calculated after solar analysis
-                    retrograde=retrograde,
+                    retrograde=speed < 0,
                     speed=speed
                 )
                 
@@ -450,28 +675,36 @@ class EnhancedTraditionalAstrologicalCalculator:
             houses = [i * 30.0 for i in range(12)]
         
         # Calculate house positions and house rulers
-        house_rulers = {}
-        for i, cusp in enumerate(houses, 1):
-            sign = self._get_sign(cusp)
-            house_rulers[i] = sign.ruler
+        house_rulers = {
+            i: _RULER_BY_DEGREE[int(cusp % 360.0)] for i, cusp in enumerate(houses, 1)
+        }
         
         # Update planet house positions
-        for planet_pos in planets.values():
-            house = self._calculate_house_position(planet_pos.longitude, houses)
+        positions = list(planets.values())
+        house_numbers = self._calculate_house_positions(
+            [planet_pos.longitude for planet_pos in positions], houses)
+        for planet_pos, house in zip(positions, house_numbers):
             planet_pos.house = house
         
         # Enhanced solar condition analysis
         sun_pos = planets[Planet.SUN]
         solar_analyses = {}
+        # Same for every planet's visibility check, so compute it once
+        sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut)
+        # Day chart when the Sun is in houses 7-12 (below horizon)
+        is_day = sun_pos.house >= 7
+        angular_cusps = self._angular_cusps(houses)
         
         for planet_enum, planet_pos in planets.items():
             solar_analysis = self._analyze_enhanced_solar_condition(
-                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut)
+                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut, config=config,
+                sun_altitude=sun_altitude)
             solar_analyses[planet_enum] = solar_analysis
             
             # Calculate comprehensive traditional dignity with all factors
             planet_pos.dignity_score = self._calculate_comprehensive_traditional_dignity(
-                planet_pos.planet, planet_pos, houses, planets[Planet.SUN], solar_analysis)
+                planet_pos.planet, planet_pos, houses, sun_pos, solar_analysis,
+                config=config, is_day=is_day, angular_cusps=angular_cusps)
         
         # Calculate enhanced traditional aspects
         aspects = calculate_enhanced_aspects(planets, jd_ut)
@@ -502,6 +735,12 @@ class EnhancedTraditionalAstrologicalCalculator:
             moon_next_aspect=moon_next_aspect
         )
         
+        # Cache an immutable pickled snapshot so callers can mutate the returned
+        # chart; pickling costs a fraction of a deepcopy on every miss
+        self._chart_cache[cache_key] = (config, pickle.dumps(chart, pickle.HIGHEST_PROTOCOL))
+        if len(self._chart_cache) > self.CHART_CACHE_SIZE:
+            self._chart_cache.popitem(last=False)
+        
         return chart
     
     
@@ -510,7 +749,8 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _analyze_enhanced_solar_condition(self, planet: Planet, planet_pos: PlanetPosition, 
                                         sun_pos: PlanetPosition, lat: float, lon: float,
-                                        jd_ut: float) -> SolarAnalysis:
+                                        jd_ut: float, config=None,
+                                        sun_altitude: Optional[float] = None) -> SolarAnalysis:
         """Enhanced solar condition analysis with configuration"""
         
         # Don't analyze the Sun itself
@@ -525,77 +765,50 @@ class EnhancedTraditionalAstrologicalCalculator:
         # Calculate elongation
         elongation = calculate_elongation(planet_pos.longitude, sun_pos.longitude)
         
-        # Get configured orbs
-        cazimi_orb = cfg().orbs.cazimi_orb_arcmin / 60.0  # Convert arcminutes to degrees
-        combustion_orb = cfg().orbs.combustion_orb
-        under_beams_orb = cfg().orbs.under_beams_orb
+        # Get configured orbs, walked in order of precedence
+        orbs = (config or cfg()).orbs
+        solar_bands = (
+            (orbs.cazimi_orb_arcmin / 60.0, SolarCondition.CAZIMI),  # arcminutes to degrees
+            (orbs.combustion_orb, SolarCondition.COMBUSTION),
+            (orbs.under_beams_orb, SolarCondition.UNDER_BEAMS),
+        )
         
-        # Enhanced visibility check for Venus and Mercury
-        traditional_exception = False
-        if planet in self.combustion_resistant:
-            traditional_exception = self._check_enhanced_combustion_exception(
-                planet, planet_pos, sun_pos, lat, lon, jd_ut)
+        condition = SolarCondition.FREE  # Free of solar interference
+        for orb, band_condition in solar_bands:
+            if elongation <= orb:
+                condition = band_condition
+                break
         
-        # Determine condition by hierarchy
-        if elongation <= cazimi_orb:
-            # Cazimi - Heart of the Sun (maximum dignity)
+        exact_cazimi = False
+        traditional_exception = False
+        if condition == SolarCondition.CAZIMI:
+            # Cazimi - Heart of the Sun (maximum dignity); overrides exceptions
             exact_cazimi = elongation <= (3/60)  # Within 3 arcminutes = exact cazimi
-            return SolarAnalysis(
-                planet=planet,
-                distance_from_sun=elongation,
-                condition=SolarCondition.CAZIMI,
-                exact_cazimi=exact_cazimi,
-                traditional_exception=False  # Cazimi overrides exceptions
-            )
-        
-        elif elongation <= combustion_orb:
-            # Combustion - but check for traditional exceptions
+        elif condition != SolarCondition.FREE and planet in self.combustion_resistant:
+            # Enhanced visibility check for Venus and Mercury: the exception
+            # negates combustion and reduces under the beams to free
+            traditional_exception = self._check_enhanced_combustion_exception(
+                planet, planet_pos, sun_pos, lat, lon, jd_ut, elongation=elongation,
+                sun_altitude=sun_altitude)
             if traditional_exception:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.FREE,  # Exception negates combustion
-                    traditional_exception=True
-                )
-            else:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.COMBUSTION,
-                    traditional_exception=False
-                )
+                condition = SolarCondition.FREE
         
-        elif elongation <= under_beams_orb:
-            # Under the Beams - with exception handling
-            if traditional_exception:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.FREE,  # Exception reduces to free
-                    traditional_exception=True
-                )
-            else:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.UNDER_BEAMS,
-                    traditional_exception=False
-                )
-        
-        # Free of solar interference
         return SolarAnalysis(
             planet=planet,
             distance_from_sun=elongation,
-            condition=SolarCondition.FREE,
-            traditional_exception=False
+            condition=condition,
+            exact_cazimi=exact_cazimi,
+            traditional_exception=traditional_exception
         )
     
     def _check_enhanced_combustion_exception(self, planet: Planet, planet_pos: PlanetPosition,
                                            sun_pos: PlanetPosition, lat: float, lon: float, 
-                                           jd_ut: float) -> bool:
+                                           jd_ut: float, elongation: Optional[float] = None,
+                                           sun_altitude: Optional[float] = None) -> bool:
         """Enhanced combustion exception check with visibility calculations"""
         
-        elongation = calculate_elongation(planet_pos.longitude, sun_pos.longitude)
+        if elongation is None:
+            elongation = calculate_elongation(planet_pos.longitude, sun_pos.longitude)
         
         # Must have minimum 10° elongation
         if elongation < 10.0:
@@ -605,7 +818,8 @@ class EnhancedTraditionalAstrologicalCalculator:
         is_oriental = is_planet_oriental(planet_pos.longitude, sun_pos.longitude)
         
         # Get Sun altitude at civil twilight
-        sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut)
+        if sun_altitude is None:
+            sun_altitude = sun_altitude_at_civil_twilight(lat, lon, jd_ut)
         
         # Classical visibility conditions
         if planet == Planet.MERCURY:
@@ -630,60 +844,38 @@ class EnhancedTraditionalAstrologicalCalculator:
         return False
     
     def _calculate_enhanced_dignity(self, planet: Planet, sign: Sign, house: int, 
-                                  solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                  solar_analysis: Optional[SolarAnalysis] = None,
+                                  config=None) -> int:
         """Enhanced dignity calculation with configuration"""
         score = 0
-        config = cfg()
+        config = config or cfg()
         
         # Rulership
         if sign.ruler == planet:
             score += config.dignity.rulership
         
         # Exaltation
-        if planet in self.exaltations and self.exaltations[planet] == sign:
+        if self.exaltations.get(planet) is sign:
             score += config.dignity.exaltation
         
         # Detriment - opposite to rulership
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
+        if sign in _DETRIMENT_SIGNS.get(planet, _EMPTY_SIGNS):
             score += config.dignity.detriment
         
         # Fall
-        if planet in self.falls and self.falls[planet] == sign:
+        if self.falls.get(planet) is sign:
             score += config.dignity.fall
         
         # House considerations - traditional joys
-        house_joys = {
-            Planet.MERCURY: 1,  # 1st house
-            Planet.MOON: 3,     # 3rd house
-            Planet.VENUS: 5,    # 5th house
-            Planet.MARS: 6,     # 6th house
-            Planet.SUN: 9,      # 9th house
-            Planet.JUPITER: 11, # 11th house
-            Planet.SATURN: 12   # 12th house
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if _HOUSE_JOYS.get(planet) == house:
             score += config.dignity.joy
         
         # ENHANCED: Use 5° rule for angularity determination
         # This requires access to houses and longitude - will be handled in calling function
         # For now, use traditional classification
-        if house in [1, 4, 7, 10]:
-            score += config.dignity.angular
-        elif house in [2, 5, 8, 11]:  # Succedent houses
-            score += config.dignity.succedent
-        elif house in [3, 6, 9, 12]:  # Cadent houses
-            score += config.dignity.cadent
+        dignity = config.dignity
+        house_scores = (0, dignity.angular, dignity.succedent, dignity.cadent)
+        score += house_scores[_HOUSE_CLASS_INDEX[house]]
         
         # Enhanced solar conditions
         if solar_analysis:
@@ -708,58 +900,28 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _calculate_comprehensive_traditional_dignity(self, planet: Planet, planet_pos: PlanetPosition, 
                                                    houses: List[float], sun_pos: PlanetPosition,
-                                                   solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                                   solar_analysis: Optional[SolarAnalysis] = None,
+                                                   config=None, is_day: Optional[bool] = None,
+                                                   angular_cusps: Optional[Tuple[float, ...]] = None) -> int:
         """Comprehensive traditional dignity scoring with all classical factors (ENHANCED)"""
-        score = 0
-        config = cfg()
-        sign = self._get_sign(planet_pos.longitude)
+        config = config or cfg()
         house = planet_pos.house
+        if is_day is None:
+            is_day = sun_pos.house >= 7  # Houses below horizon = day
         
-        # === ESSENTIAL DIGNITIES ===
-        
-        # Rulership (+5)
-        if sign.ruler == planet:
-            score += config.dignity.rulership
-        
-        # Exaltation (+4)
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
-        
-        # Triplicity (+3) - traditional day/night rulers
-        triplicity_score = self._calculate_triplicity_dignity(planet, sign, sun_pos)
-        score += triplicity_score
-        
-        # Detriment (-5)
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN], 
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
-        
-        # Fall (-4)
-        if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
+        # === ESSENTIAL DIGNITIES AND HAYZ ===
+        # Rulership, exaltation, triplicity, detriment, fall and sect bonus
+        score = self._sect_dignity_table(config, is_day)[planet, planet_pos.sign]
         
         # === ACCIDENTAL DIGNITIES ===
         
         # House joys (+2)
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if _HOUSE_JOYS.get(planet) == house:
             score += config.dignity.joy
         
         # Angularity with 5° rule
-        angularity = self._get_traditional_angularity(planet_pos.longitude, houses, house)
+        angularity = self._get_traditional_angularity(planet_pos.longitude, houses, house,
+                                                      angular_cusps)
         
         if angularity == "angular":
             score += config.dignity.angular
@@ -771,17 +933,13 @@ class EnhancedTraditionalAstrologicalCalculator:
         # === ADVANCED TRADITIONAL FACTORS ===
         
         # Speed considerations
-        speed_bonus = self._calculate_speed_dignity(planet, planet_pos.speed)
+        speed_bonus = self._calculate_speed_dignity(planet, planet_pos.speed, config)
         score += speed_bonus
         
         # Retrograde penalty
         if planet_pos.retrograde:
             score += config.retrograde.dignity_penalty
         
-        # Hayz (sect/time) bonus for planets in proper sect
-        hayz_bonus = self._calculate_hayz_dignity(planet, sun_pos, houses)
-        score += hayz_bonus
-        
         # Solar conditions
         if solar_analysis:
             condition = solar_analysis.condition
@@ -800,48 +958,59 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         return score
     
-    def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition) -> int:
-        """Calculate traditional triplicity dignity (ENHANCED)"""
-        # Traditional triplicity rulers by element and day/night (CORRECTED)
-        triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius) 
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-            
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-            
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.SCORPIO: {"day": Planet.VENUS, "night": Planet.MARS},
-            Sign.PISCES: {"day": Planet.VENUS, "night": Planet.MARS}
-        }
+    def _sect_dignity_table(self, config, is_day: bool) -> Dict[Tuple[Planet, Sign], int]:
+        """Essential dignity plus hayz for every planet/sign pair in one sect
         
-        if sign not in triplicity_rulers:
+        These terms depend only on the planet, its sign and whether the chart
+        is diurnal, so they are scored once per configuration and looked up
+        for each planet of each chart. In-place edits to the configuration
+        object are not seen (see the class docstring).
+        """
+        cached = self._dignity_tables.get(is_day)
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        
+        dignity = config.dignity
+        table = {}
+        for planet in self.planets_swe:
+            hayz = self._calculate_hayz_dignity(planet, None, None, config, is_day=is_day)
+            for sign in Sign:
+                score = hayz
+                if sign.ruler == planet:
+                    score += dignity.rulership
+                if self.exaltations.get(planet) is sign:
+                    score += dignity.exaltation
+                score += self._calculate_triplicity_dignity(planet, sign, None, config,
+                                                            is_day=is_day)
+                if sign in _DETRIMENT_SIGNS.get(planet, _EMPTY_SIGNS):
+                    score += dignity.detriment
+                if self.falls.get(planet) is sign:
+                    score += dignity.fall
+                table[planet, sign] = score
+        
+        self._dignity_tables[is_day] = (config, table)
+        return table
+    
+    def _calculate_triplicity_dignity(self, planet: Planet, sign: Sign, sun_pos: PlanetPosition,
+                                      config=None, is_day: Optional[bool] = None) -> int:
+        """Calculate traditional triplicity dignity (ENHANCED)"""
+        rulers = _TRIPLICITY_RULERS.get(sign)
+        if rulers is None:
             return 0
             
         # Determine if it's day or night (Sun above or below horizon)
         # Day = Sun in houses 7-12 (below horizon), Night = Sun in houses 1-6 (above horizon)
-        sun_house = sun_pos.house
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
-        sect = "day" if is_day else "night"
+        if is_day is None:
+            is_day = sun_pos.house >= 7  # Houses below horizon = day
         
-        if triplicity_rulers[sign][sect] == planet:
-            return cfg().dignity.triplicity  # Configurable triplicity score
+        if rulers[0 if is_day else 1] == planet:
+            return (config or cfg()).dignity.triplicity  # Configurable triplicity score
             
         return 0
     
-    def _calculate_speed_dignity(self, planet: Planet, speed: float) -> int:
+    def _calculate_speed_dignity(self, planet: Planet, speed: float, config=None) -> int:
         """Calculate dignity bonus/penalty based on planetary speed (ENHANCED)"""
-        config = cfg()
+        config = config or cfg()
         
         # Traditional fast/slow considerations
         if planet == Planet.MOON:
@@ -849,10 +1018,10 @@ class EnhancedTraditionalAstrologicalCalculator:
                 return config.dignity.speed_bonus
             elif speed < 11.0:  # Slow Moon  
                 return config.dignity.speed_penalty
-        elif planet in [Planet.MERCURY, Planet.VENUS]:
+        elif planet in _INFERIOR_PLANETS:
             if speed > 1.0:  # Fast inferior planets
                 return config.dignity.speed_bonus
-        elif planet in [Planet.MARS, Planet.JUPITER, Planet.SATURN]:
+        elif planet in _SUPERIOR_PLANETS:
             if speed > 0.3:  # Fast superior planets
                 return config.dignity.speed_bonus
             elif speed < 0.1:  # Very slow (near station)
@@ -860,71 +1029,51 @@ class EnhancedTraditionalAstrologicalCalculator:
                 
         return 0
     
-    def _calculate_hayz_dignity(self, planet: Planet, sun_pos: PlanetPosition, houses: List[float]) -> int:
+    def _calculate_hayz_dignity(self, planet: Planet, sun_pos: PlanetPosition, houses: List[float],
+                                config=None, is_day: Optional[bool] = None) -> int:
         """Calculate hayz (sect) dignity bonus (ENHANCED)"""
-        config = cfg()
+        config = config or cfg()
         
         # Determine if Sun is above horizon (day) or below (night)
-        sun_house = self._calculate_house_position(sun_pos.longitude, houses)
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Houses below horizon = day
-        
-        # Traditional sect assignments
-        diurnal_planets = [Planet.SUN, Planet.JUPITER, Planet.SATURN]  
-        nocturnal_planets = [Planet.MOON, Planet.VENUS, Planet.MARS]
-        
-        if planet in diurnal_planets and is_day:
-            return config.dignity.hayz_bonus  # Diurnal planet in day chart
-        elif planet in nocturnal_planets and not is_day:
-            return config.dignity.hayz_bonus  # Nocturnal planet in night chart
-        elif planet in diurnal_planets and not is_day:
-            return config.dignity.hayz_penalty  # Diurnal planet in night chart
-        elif planet in nocturnal_planets and is_day:
-            return config.dignity.hayz_penalty  # Nocturnal planet in day chart
-            
-        # Mercury is neutral
-        return 0
+        if is_day is None:
+            is_day = sun_pos.house >= 7  # Houses below horizon = day
+        
+        sect = _SECT_SIGN.get(planet, 0)
+        if not sect:
+            return 0  # Mercury is neutral
+        
+        # Bonus when the planet's sect matches the chart's, penalty otherwise
+        if (sect > 0) == is_day:
+            return config.dignity.hayz_bonus
+        return config.dignity.hayz_penalty
     
     
     def _calculate_enhanced_dignity_with_5degree_rule(self, planet: Planet, planet_pos: PlanetPosition, 
                                                      houses: List[float], 
-                                                     solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                                     solar_analysis: Optional[SolarAnalysis] = None,
+                                                     config=None) -> int:
         """Enhanced dignity calculation with 5° rule for angularity (ENHANCED)"""
         score = 0
-        config = cfg()
-        sign = self._get_sign(planet_pos.longitude)
+        config = config or cfg()
+        sign = planet_pos.sign  # already resolved when the position was built
         house = planet_pos.house
         
         # Basic dignities (same as before)
         if sign.ruler == planet:
             score += config.dignity.rulership
         
-        if planet in self.exaltations and self.exaltations[planet] == sign:
+        if self.exaltations.get(planet) is sign:
             score += config.dignity.exaltation
         
         # Detriment
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
+        if sign in _DETRIMENT_SIGNS.get(planet, _EMPTY_SIGNS):
             score += config.dignity.detriment
         
-        if planet in self.falls and self.falls[planet] == sign:
+        if self.falls.get(planet) is sign:
             score += config.dignity.fall
         
         # House joys
-        house_joys = {
-            Planet.MERCURY: 1, Planet.MOON: 3, Planet.VENUS: 5,
-            Planet.MARS: 6, Planet.SUN: 9, Planet.JUPITER: 11, Planet.SATURN: 12
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
+        if _HOUSE_JOYS.get(planet) == house:
             score += config.dignity.joy
         
         # ENHANCED: Apply 5° rule for angularity
@@ -958,66 +1107,127 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _get_sign(self, longitude: float) -> Sign:
         """Get zodiac sign from longitude"""
-        longitude = longitude % 360
-        for sign in Sign:
-            if sign.start_degree <= longitude < (sign.start_degree + 30):
-                return sign
-        return Sign.PISCES
+        return _SIGN_BY_DEGREE[int(longitude % 360.0)]
     
     def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
         """Calculate house position"""
-        longitude = longitude % 360
+        return self._calculate_house_positions([longitude % 360], houses)[0]
+    
+    def _calculate_house_positions(self, longitudes: List[float], houses: List[float]) -> List[int]:
+        """Calculate house positions for several normalized (0-360°) longitudes
+        against the same cusps"""
+        # Normalize cusps and pair each with the next one once for all longitudes
+        cusps = [houses[i] % 360 for i in range(12)]
+        bounds = list(enumerate(zip(cusps, cusps[1:] + cusps[:1]), 1))
         
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
-            
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
+        positions = []
+        for longitude in longitudes:
+            house = 1
+            for number, (current_cusp, next_cusp) in bounds:
+                if current_cusp > next_cusp:  # Crosses 0°
+                    if longitude >= current_cusp or longitude < next_cusp:
+                        house = number
+                        break
+                elif current_cusp <= longitude < next_cusp:
+                    house = number
+                    break
+            positions.append(house)
         
-        return 1
+        return positions
+    
+    @staticmethod
+    def _angular_cusps(houses: List[float]) -> Tuple[float, ...]:
+        """Normalized cusps of the 1st, 4th, 7th and 10th houses"""
+        return (houses[0] % 360, houses[3] % 360, houses[6] % 360, houses[9] % 360)
     
-    def _get_traditional_angularity(self, longitude: float, houses: List[float], house: int) -> str:
-        """Determine traditional angularity using 5° rule (ENHANCED)"""
-        longitude = longitude % 360
+    def _get_traditional_angularity(self, longitude: float, houses: List[float], house: int,
+                                    angular_cusps: Optional[Tuple[float, ...]] = None) -> str:
+        """Determine traditional angularity using 5° rule (ENHANCED)
         
-        # Get angular house cusps (1st, 4th, 7th, 10th)
-        angular_cusps = [houses[0], houses[3], houses[6], houses[9]]  # 1st, 4th, 7th, 10th
+        ``longitude`` is a chart position, already normalized to 0-360°.
+        ``angular_cusps`` may be precomputed with ``_angular_cusps`` when
+        several planets of the same chart are checked.
+        """
+        if angular_cusps is None:
+            angular_cusps = self._angular_cusps(houses)
         
-        # Check proximity to angular cusps (5° rule)
+        # Check proximity to angular cusps (1st, 4th, 7th, 10th) using the 5° rule;
+        # the shortest arc is within 5° when the raw gap is <= 5° or >= 355°
         for cusp in angular_cusps:
-            cusp = cusp % 360
-            
-            # Calculate minimum distance to cusp
-            distance = min(
-                abs(longitude - cusp),
-                360 - abs(longitude - cusp)
-            )
-            
-            if distance <= 5.0:
+            gap = abs(longitude - cusp)
+            if gap <= 5.0 or gap >= 355.0:
                 return "angular"
         
         # Traditional house classification
-        if house in [1, 4, 7, 10]:
-            return "angular"
-        elif house in [2, 5, 8, 11]:
-            return "succedent"
-        else:  # houses 3, 6, 9, 12
-            return "cadent"
+        return _HOUSE_CLASS_NAMES[_HOUSE_CLASS_INDEX[house]]
+
+
+# Per-process calculator used by ``calculate_charts_batch`` workers
+_batch_calculator: Optional[EnhancedTraditionalAstrologicalCalculator] = None
+
+
+def _init_batch_worker() -> None:
+    """Create the worker's calculator once; ephemeris state is process-local."""
+    global _batch_calculator
+    _batch_calculator = EnhancedTraditionalAstrologicalCalculator()
+
+
+def _calculate_batch_chart(request: Tuple[Any, ...]) -> HoraryChart:
+    return _batch_calculator.calculate_chart(*request)
+
+
+def calculate_charts_batch(
+    requests: List[Tuple[Any, ...]], max_workers: Optional[int] = None
+) -> List[HoraryChart]:
+    """Calculate several charts in parallel worker processes.
+
+    Each request holds the positional arguments of
+    :meth:`EnhancedTraditionalAstrologicalCalculator.calculate_chart`:
+    ``(dt_local, dt_utc, timezone_info, lat, lon, location_name)``. The pool
+    is sized to ``os.cpu_count()`` by default and results keep the order of
+    ``requests``.
+    """
+    if not requests:
+        return []
+    workers = min(max_workers or os.cpu_count() or 1, len(requests))
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_batch_worker
+    ) as pool:
+        return list(pool.map(_calculate_batch_chart, requests))
 
 
 class EnhancedTraditionalHoraryJudgmentEngine:
-    """Enhanced Traditional horary judgment engine with configuration system"""
+    """Enhanced Traditional horary judgment engine with configuration system
+    
+    Resolved solar settings, and the void-of-course, reception and Moon
+    testimony memos kept on charts, are reused while ``cfg()`` returns the
+    configuration object they were computed with. Changing configuration
+    values in place is not detected: call ``HoraryConfig.reset()`` (or
+    ``load_test_config``), or use a fresh engine and freshly calculated charts.
+    """
     
     def __init__(self):
         self.question_analyzer = TraditionalHoraryQuestionAnalyzer()
         self.timezone_manager = TimezoneManager()
         self.calculator = EnhancedTraditionalAstrologicalCalculator(timezone_manager=self.timezone_manager)
         self.reception_calculator = TraditionalReceptionCalculator()
+        # Resolved solar judgment settings with the configuration they came from
+        self._solar_settings: Optional[Tuple[Any, SimpleNamespace]] = None
+    
+    def _solar_judgment_settings(self, config) -> SimpleNamespace:
+        """Solar judgment settings with optional keys defaulted, resolved once per configuration"""
+        cached = self._solar_settings
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        
+        solar_confidence = config.confidence.solar
+        settings = SimpleNamespace(
+            r17b_enabled=getattr(getattr(config, "solar", None), "severe_impediment_denial_enabled", False),
+            cazimi_bonus=solar_confidence.cazimi_bonus,
+            under_beams_penalty=solar_confidence.under_beams_penalty,
+        )
+        self._solar_settings = (config, settings)
+        return settings
     
     def judge_question(self, question: str, location: str, 
                       date_str: Optional[str] = None, time_str: Optional[str] = None,
@@ -1029,23 +1239,23 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                       ignore_combustion: bool = False,
                       ignore_saturn_7th: bool = False,
                       # Legacy reception weighting (now configurable)
-                      exaltation_confidence_boost: float = None) -> Dict[str, Any]:
+                      exaltation_confidence_boost: float = None,
+                      # Skip decorative general info/considerations (e.g. batch rescoring)
+                      compute_general: bool = True,
+                      # "judgment_only" omits the frontend chart/lunar payload
+                      return_payload: Literal["full", "judgment_only"] = "full",
+                      # Empty traditional/solar factors for bulk re-judgment
+                      detailed: bool = True) -> Dict[str, Any]:
         """Enhanced Traditional horary judgment with configuration system"""
         
         logger.info("=== JUDGE_QUESTION METHOD CALLED ===")
         logger.info(f"Location parameter: {location}")
         
         try:
-            # Use configured values if not overridden
             config = cfg()
-            if exaltation_confidence_boost is None:
-                exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
             
-            # Fail-fast geocoding
-            try:
-                lat, lon, full_location = safe_geocode(location)
-            except LocationError as e:
-                raise e
+            # Fail-fast geocoding (LocationError is reported below)
+            lat, lon, full_location = safe_geocode(location)
             
             # Handle datetime with proper timezone support
             if use_current_time:
@@ -1066,60 +1276,22 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 question_analysis["relevant_houses"] = manual_houses
                 question_analysis["significators"]["quesited_house"] = manual_houses[1] if len(manual_houses) > 1 else 7
             
-            # Extract window_days from timeframe analysis
-            timeframe_analysis = question_analysis.get("timeframe_analysis", {})
-            window_days = timeframe_analysis.get("window_days")
-            
-            # Use default window if no timeframe specified
-            if window_days is None:
-                config = cfg()
-                window_days = getattr(config.timing, "default_window_days", 90)
-            
-            # Apply enhanced judgment with configuration
-            judgment = self._apply_enhanced_judgment(
-                chart, question_analysis,
+            result = self._judge_chart(
+                chart, question, question_analysis,
                 ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
-                exaltation_confidence_boost, window_days)
-
-            judgment["reasoning"] = _structure_reasoning(judgment.get("reasoning", []))
-
-            # Serialize chart data for frontend
-            chart_data_serialized = serialize_chart_for_frontend(chart, chart.solar_analyses)
-
-            general_info = self._calculate_general_info(chart)
-            considerations = self._calculate_considerations(chart, question_analysis)
-
-            return {
-                "question": question,
-                "judgment": judgment["result"],
-                "confidence": judgment["confidence"],
-                "reasoning": judgment["reasoning"],
-                
-                "chart_data": chart_data_serialized,
-                
-                "question_analysis": question_analysis,
-                "timing": judgment.get("timing"),
-                "moon_aspects": self._build_moon_story(chart),  # Enhanced Moon story
-                "traditional_factors": judgment.get("traditional_factors", {}),
-                "solar_factors": judgment.get("solar_factors", {}),
-                "general_info": general_info,
-                "considerations": considerations,
-                
-                # NEW: Enhanced lunar aspects
-                "moon_last_aspect": serialize_lunar_aspect(chart.moon_last_aspect),
-                "moon_next_aspect": serialize_lunar_aspect(chart.moon_next_aspect),
-                
-                "timezone_info": {
-                    "local_time": dt_local.isoformat(),
-                    "utc_time": dt_utc.isoformat(),
-                    "timezone": timezone_used,
-                    "location_name": full_location,
-                    "coordinates": {
-                        "latitude": lat,
-                        "longitude": lon
-                    }
+                exaltation_confidence_boost, compute_general, config, return_payload, detailed)
+            
+            result["timezone_info"] = {
+                "local_time": dt_local.isoformat(),
+                "utc_time": dt_utc.isoformat(),
+                "timezone": timezone_used,
+                "location_name": full_location,
+                "coordinates": {
+                    "latitude": lat,
+                    "longitude": lon
                 }
             }
+            return result
             
         except LocationError as e:
             return {
@@ -1140,6 +1312,77 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "reasoning": _structure_reasoning([f"Calculation error: {e}"])
             }
     
+    def _judge_chart(self, chart: HoraryChart, question: str, question_analysis: Dict[str, Any],
+                     ignore_radicality: bool = False, ignore_void_moon: bool = False,
+                     ignore_combustion: bool = False, ignore_saturn_7th: bool = False,
+                     exaltation_confidence_boost: float = None, compute_general: bool = True,
+                     config=None,
+                     return_payload: Literal["full", "judgment_only"] = "full",
+                     detailed: bool = True) -> Dict[str, Any]:
+        """Judge an already calculated chart and build the response payload
+        
+        Geocoding, time parsing and error reporting stay in ``judge_question``;
+        this core only works on the chart and question analysis, so charts built
+        elsewhere (e.g. batch calculation) can be judged directly.
+        
+        With ``return_payload="judgment_only"`` the serialized chart, general
+        info, considerations and last/next lunar aspects are left out. With
+        ``detailed=False`` the traditional and solar factors are empty dicts.
+        """
+        if return_payload not in ("full", "judgment_only"):
+            raise ValueError(f"Unknown return_payload: {return_payload!r}")
+        config = config or cfg()
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
+        
+        # Extract window_days from timeframe analysis, defaulting when no timeframe specified
+        timeframe_analysis = question_analysis.get("timeframe_analysis", {})
+        window_days = timeframe_analysis.get("window_days")
+        if window_days is None:
+            window_days = getattr(config.timing, "default_window_days", 90)
+        
+        # Apply enhanced judgment with configuration
+        judgment = self._apply_enhanced_judgment(
+            chart, question_analysis,
+            ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
+            exaltation_confidence_boost, window_days, detailed)
+
+        judgment["reasoning"] = _structure_reasoning(judgment.get("reasoning", []))
+
+        result = {
+            "question": question,
+            "judgment": judgment["result"],
+            "confidence": judgment["confidence"],
+            "reasoning": judgment["reasoning"],
+            
+            "question_analysis": question_analysis,
+            "timing": judgment.get("timing"),
+            "moon_aspects": self._build_moon_story(chart, config),  # Enhanced Moon story
+            "traditional_factors": judgment.get("traditional_factors", {}) if detailed else {},
+            "solar_factors": judgment.get("solar_factors", {}) if detailed else {},
+        }
+        if return_payload == "judgment_only":
+            return result
+
+        if compute_general:
+            general_info = self._calculate_general_info(chart)
+            considerations = self._calculate_considerations(chart, question_analysis)
+        else:
+            general_info = {}
+            considerations = {}
+
+        result.update({
+            # Serialize chart data for frontend
+            "chart_data": serialize_chart_for_frontend(chart, chart.solar_analyses),
+            "general_info": general_info,
+            "considerations": considerations,
+            
+            # NEW: Enhanced lunar aspects
+            "moon_last_aspect": serialize_lunar_aspect(chart.moon_last_aspect),
+            "moon_next_aspect": serialize_lunar_aspect(chart.moon_next_aspect),
+        })
+        return result
+    
     def _moon_aspects_significator_directly(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> bool:
         """
         HELPER: Check if Moon's next aspect is directly to a significator
@@ -1154,66 +1397,38 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     
     # NEW: Enhanced Moon accidental dignity helpers
-    def _moon_phase_bonus(self, chart: HoraryChart) -> int:
+    def _moon_elongation(self, chart: HoraryChart) -> float:
+        """Angular distance (0-180°) between the Moon and the Sun"""
+        return calculate_elongation(chart.moon.longitude, chart.sun.longitude)
+    
+    def _moon_phase_bonus(self, chart: HoraryChart, config=None) -> int:
         """Calculate Moon phase bonus from configuration"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        sun_pos = chart.planets[Planet.SUN]
-        
-        # Calculate angular distance (elongation)
-        elongation = abs(moon_pos.longitude - sun_pos.longitude)
-        if elongation > 180:
-            elongation = 360 - elongation
-        
-        config = cfg()
+        elongation = self._moon_elongation(chart)
         
         # Determine phase and return bonus
-        if 0 <= elongation < 30:
-            return config.moon.phase_bonus.new_moon
-        elif 30 <= elongation < 60:
-            return config.moon.phase_bonus.waxing_crescent
-        elif 60 <= elongation < 120:
-            return config.moon.phase_bonus.first_quarter
-        elif 120 <= elongation < 150:
-            return config.moon.phase_bonus.waxing_gibbous
-        elif 150 <= elongation < 210:
-            return config.moon.phase_bonus.full_moon
-        elif 210 <= elongation < 240:
-            return config.moon.phase_bonus.waning_gibbous
-        elif 240 <= elongation < 300:
-            return config.moon.phase_bonus.last_quarter
-        else:  # 300 <= elongation < 360
-            return config.moon.phase_bonus.waning_crescent
+        phase = bisect_right(_MOON_PHASE_EDGES, elongation)
+        return getattr((config or cfg()).moon.phase_bonus, _MOON_PHASE_KEYS[phase])
     
-    def _moon_speed_bonus(self, chart: HoraryChart) -> int:
+    def _moon_speed_bonus(self, chart: HoraryChart, config=None) -> int:
         """Calculate Moon speed bonus from configuration"""
         
-        moon_speed = abs(chart.planets[Planet.MOON].speed)
-        config = cfg()
-        
-        if moon_speed < 11.0:
-            return config.moon.speed_bonus.very_slow
-        elif moon_speed < 12.0:
-            return config.moon.speed_bonus.slow
-        elif moon_speed < 14.0:
-            return config.moon.speed_bonus.average
-        elif moon_speed < 15.0:
-            return config.moon.speed_bonus.fast
-        else:
-            return config.moon.speed_bonus.very_fast
+        moon_speed = abs(chart.moon.speed)
+        bucket = bisect_right(_MOON_SPEED_EDGES, moon_speed)
+        return getattr((config or cfg()).moon.speed_bonus, _MOON_SPEED_KEYS[bucket])
     
-    def _moon_angularity_bonus(self, chart: HoraryChart) -> int:
+    def _moon_angularity_bonus(self, chart: HoraryChart, config=None) -> int:
         """Calculate Moon angularity bonus from configuration"""
         
-        moon_house = chart.planets[Planet.MOON].house
-        config = cfg()
+        moon_house = chart.moon.house
+        angularity_bonus = (config or cfg()).moon.angularity_bonus
         
-        if moon_house in [1, 4, 7, 10]:
-            return config.moon.angularity_bonus.angular
-        elif moon_house in [2, 5, 8, 11]:
-            return config.moon.angularity_bonus.succedent
+        if (_ANGULAR_MASK >> moon_house) & 1:
+            return angularity_bonus.angular
+        elif (_SUCCEDENT_MASK >> moon_house) & 1:
+            return angularity_bonus.succedent
         else:  # cadent houses 3, 6, 9, 12
-            return config.moon.angularity_bonus.cadent
+            return angularity_bonus.cadent
 
     # ---------------- General Info Helpers -----------------
 
@@ -1237,6 +1452,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         6: Planet.SUN        # Sunday
     }
 
+    HOUR_RULERS = _build_hour_ruler_table(PLANET_SEQUENCE, PLANETARY_DAY_RULERS)
+
     LUNAR_MANSIONS = [
         "Al Sharatain", "Al Butain", "Al Thurayya", "Al Dabaran",
         "Al Hak'ah", "Al Han'ah", "Al Dhira", "Al Nathrah",
@@ -1250,43 +1467,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
     def _get_moon_phase_name(self, chart: HoraryChart) -> str:
         """Return textual Moon phase name"""
-        moon_pos = chart.planets[Planet.MOON]
-        sun_pos = chart.planets[Planet.SUN]
-
-        elongation = abs(moon_pos.longitude - sun_pos.longitude)
-        if elongation > 180:
-            elongation = 360 - elongation
-
-        if 0 <= elongation < 30:
-            return "New Moon"
-        elif 30 <= elongation < 60:
-            return "Waxing Crescent"
-        elif 60 <= elongation < 120:
-            return "First Quarter"
-        elif 120 <= elongation < 150:
-            return "Waxing Gibbous"
-        elif 150 <= elongation < 210:
-            return "Full Moon"
-        elif 210 <= elongation < 240:
-            return "Waning Gibbous"
-        elif 240 <= elongation < 300:
-            return "Last Quarter"
-        else:
-            return "Waning Crescent"
+        elongation = self._moon_elongation(chart)
+        return _MOON_PHASE_NAMES[bisect_right(_MOON_PHASE_EDGES, elongation)]
 
     def _moon_speed_category(self, speed: float) -> str:
         """Return a text category for Moon's speed"""
-        speed = abs(speed)
-        if speed < 11.0:
-            return "Very Slow"
-        elif speed < 12.0:
-            return "Slow"
-        elif speed < 14.0:
-            return "Average"
-        elif speed < 15.0:
-            return "Fast"
-        else:
-            return "Very Fast"
+        return _MOON_SPEED_NAMES[bisect_right(_MOON_SPEED_EDGES, abs(speed))]
 
     def _calculate_general_info(self, chart: HoraryChart) -> Dict[str, Any]:
         """Calculate general chart information for frontend display"""
@@ -1294,13 +1480,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         weekday = dt_local.weekday()
         day_ruler = self.PLANETARY_DAY_RULERS.get(weekday, Planet.SUN)
 
-        hour_index = dt_local.hour
-        start_idx = self.PLANET_SEQUENCE.index(day_ruler)
-        hour_ruler = self.PLANET_SEQUENCE[(start_idx + hour_index) % 7]
+        hour_ruler = self.HOUR_RULERS[weekday][dt_local.hour]
 
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
 
-        mansion_index = int((moon_pos.longitude % 360) / (360 / 28)) + 1
+        mansion_index = int(moon_pos.longitude * _MANSION_SCALE) + 1
         mansion_name = self.LUNAR_MANSIONS[mansion_index - 1]
 
         void_info = self._is_moon_void_of_course_enhanced(chart)
@@ -1340,8 +1524,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _apply_enhanced_judgment(self, chart: HoraryChart, question_analysis: Dict,
                                ignore_radicality: bool = False, ignore_void_moon: bool = False,
                                ignore_combustion: bool = False, ignore_saturn_7th: bool = False,
-                               exaltation_confidence_boost: float = 15.0, window_days: int = None) -> Dict[str, Any]:
-        """Enhanced judgment with configuration system"""
+                               exaltation_confidence_boost: float = 15.0, window_days: int = None,
+                               detailed: bool = True) -> Dict[str, Any]:
+        """Enhanced judgment with configuration system
+        
+        ``detailed=False`` skips work that only feeds ``traditional_factors``.
+        """
         
         reasoning = []
         config = cfg()
@@ -1456,7 +1644,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         querent_planet = significators["querent"]
         quesited_planet = significators["quesited"]
-        
+        querent_pos = chart.planets[querent_planet]
+        quesited_pos = chart.planets[quesited_planet]
+        # Dignities are fixed once the chart is built; read them once for all verdicts
+        querent_strength = querent_pos.dignity_score
+        quesited_strength = quesited_pos.dignity_score
         
         # Enhanced same-ruler analysis (Fix 2 & 5)
         same_ruler_bonus = 0
@@ -1486,62 +1678,61 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         if solar_factors["significant"]:
             # Don't add generic solar conditions message - will be added below with context
-            solar_config = getattr(config, "solar", None)
-            r17b_enabled = getattr(solar_config, "severe_impediment_denial_enabled", False) if solar_config else False
+            solar_settings = self._solar_judgment_settings(config)
 
             # ENHANCED: Adjust confidence based on solar conditions affecting SIGNIFICATORS
             if solar_factors["cazimi_count"] > 0:
-                confidence += config.confidence.solar.cazimi_bonus
+                confidence += solar_settings.cazimi_bonus
                 reasoning.append("Cazimi planets significantly strengthen the judgment")
             elif (solar_factors["combustion_count"] > 0 or solar_factors["under_beams_count"] > 0) and not ignore_combustion:
                 penalty_reasons = []  # list of (reason, penalty)
                 solar_penalty = 0
-                severe_impediments = 0
-
-                for planet in [querent_planet, quesited_planet]:
-                    planet_analysis = solar_factors["detailed_analyses"].get(planet.value, {})
-                    condition = planet_analysis.get("condition")
-                    if condition not in ["Combustion", "Under the Beams"]:
-                        continue
-
-                    distance = planet_analysis.get("distance_from_sun", 0)
-                    planet_dignity = chart.planets[planet].dignity_score
-
-                    if condition == "Combustion":
-                        if distance < 1.0:
-                            severe_impediments += 1
-                            solar_penalty += 40
-                            reason = f"{planet.value} (extreme combustion at {distance:.1f}°)"
-                            penalty = 40
-                        elif distance < 2.0:
-                            solar_penalty += 25
-                            reason = f"{planet.value} (severe combustion at {distance:.1f}°)"
-                            penalty = 25
-                        elif distance < 5.0:
-                            solar_penalty += 15
-                            reason = f"{planet.value} (combustion at {distance:.1f}°)"
-                            penalty = 15
-                        else:
-                            solar_penalty += 10
-                            reason = f"{planet.value} (light combustion at {distance:.1f}°)"
-                            penalty = 10
+                ub_penalty = solar_settings.under_beams_penalty
+                # Read the chart's SolarAnalysis objects directly rather than the
+                # serialized per-planet dicts in solar_factors
+                solar_analyses = chart.solar_analyses or {}
+
+                # Only significators that are combust or under the beams need scoring
+                afflicted = []
+                for planet, planet_pos in ((querent_planet, querent_pos), (quesited_planet, quesited_pos)):
+                    planet_analysis = solar_analyses.get(planet)
+                    if planet_analysis is not None and planet_analysis.condition in _SOLAR_IMPEDIMENTS:
+                        afflicted.append((planet, planet_pos, planet_analysis))
+
+                # Rare R17b denial: decide it up front so the penalty loop below
+                # carries no severity bookkeeping
+                severe_denial = solar_settings.r17b_enabled and sum(
+                    _severe_solar_impediments(planet_analysis, planet_pos.dignity_score)
+                    for _, planet_pos, planet_analysis in afflicted
+                ) >= 2
+
+                for planet, planet_pos, planet_analysis in afflicted:
+                    if planet_analysis.condition is SolarCondition.COMBUSTION:
+                        # Same precision as reported in solar_factors
+                        distance = round(planet_analysis.distance_from_sun, 4)
+                        planet_dignity = planet_pos.dignity_score
+                        band = bisect_right(_COMBUSTION_EDGES, distance)
+                        penalty = _COMBUSTION_PENALTIES[band]
+                        solar_penalty += penalty
+                        reason = f"{planet.value} ({_COMBUSTION_LABELS[band]} at {distance:.1f}°)"
 
                         if planet_dignity <= -4 and distance < 3.0:
-                            severe_impediments += 1
                             reason += f" (also severely debilitated: {planet_dignity:+d})"
 
                         penalty_reasons.append((reason, penalty))
 
-                    elif condition == "Under the Beams":
-                        ub_penalty = config.confidence.solar.under_beams_penalty
+                    else:  # Under the Beams
                         solar_penalty += ub_penalty
                         penalty_reasons.append((f"{planet.value} under beams", ub_penalty))
 
-                if r17b_enabled and severe_impediments >= 2:
+                if severe_denial:
                     return {
                         "result": "NO",
                         "confidence": 90,
-                        "reasoning": reasoning + [f"Multiple severe solar impediments deny perfection: {', '.join(penalty_reasons)}"],
+                        "reasoning": reasoning + [
+                            "Multiple severe solar impediments deny perfection: "
+                            + ", ".join(reason for reason, _ in penalty_reasons)
+                        ],
                         "timing": None,
                         "traditional_factors": {
                             "perfection_type": "impediment_denial",
@@ -1554,15 +1745,17 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     applied_penalty = min(solar_penalty, 50)
                     confidence -= applied_penalty
 
-                    applied = 0
-                    weighted_reasons = []
-                    for reason, penalty in penalty_reasons:
-                        if applied >= applied_penalty:
-                            weight = 0
-                        else:
-                            weight = min(penalty, applied_penalty - applied)
-                            applied += weight
-                        weighted_reasons.append(f"{reason} (-{weight})")
+                    # Running total of penalties capped at the applied amount; each
+                    # reason is weighted by how much it added to that total
+                    applied = list(accumulate(
+                        (penalty for _, penalty in penalty_reasons),
+                        lambda total, penalty: min(total + penalty, applied_penalty),
+                        initial=0,
+                    ))
+                    weighted_reasons = [
+                        f"{reason} (-{after - before})"
+                        for (reason, _), before, after in zip(penalty_reasons, applied, applied[1:])
+                    ]
 
                     reasoning.append(
                         f"Solar impediment: {', '.join(weighted_reasons)}"
@@ -1578,7 +1771,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             item_name = significators.get("item_name", "item")
             
             # Check for translation patterns involving the item significator
-            translation_result = self._check_transaction_translation(chart, querent_planet, quesited_planet, item_significator)
+            translation_result = self._check_transaction_translation(
+                chart, querent_planet, quesited_planet, item_significator, ignore_combustion
+            )
             if translation_result["found"]:
                 result = "YES" if translation_result["favorable"] else "NO"
                 confidence = min(confidence, translation_result["confidence"])
@@ -1605,8 +1800,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     "traditional_factors": {
                         "perfection_type": "transaction_translation",
                         "reception": translation_result.get("reception", "none"),
-                        "querent_strength": chart.planets[querent_planet].dignity_score,
-                        "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                        "querent_strength": querent_strength,
+                        "quesited_strength": quesited_strength,
                         f"{item_name}_strength": chart.planets[item_significator].dignity_score
                     },
                     "solar_factors": solar_factors
@@ -1624,7 +1819,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             reasoning.append(f"3rd person analysis: Student ({primary_significator.value}) seeking Success ({secondary_significator.value})")
         
         perfection = self._check_enhanced_perfection(
-            chart, primary_significator, secondary_significator, exaltation_confidence_boost, window_days
+            chart, primary_significator, secondary_significator, exaltation_confidence_boost, window_days,
+            config=config, ignore_combustion=ignore_combustion
         )
 
         # Post-event mode: count recent separating aspects as positive testimony
@@ -1642,7 +1838,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         "perfects": True,
                         "type": "separating",
                         "favorable": True,
-                        "confidence": cfg().confidence.perfection.direct_basic,
+                        "confidence": config.confidence.perfection.direct_basic,
                         "reason": f"Recent separation: {self._format_aspect_for_display(primary_significator.value, sep['aspect'], secondary_significator.value, False)}",
                         "aspect": sep,
                     }
@@ -1651,15 +1847,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if perfection.get("type") == "refranation":
             return {
                 "result": "NO",
-                "confidence": min(confidence, perfection.get("confidence", cfg().confidence.denial.refranation)),
+                "confidence": min(confidence, perfection.get("confidence", config.confidence.denial.refranation)),
                 "reasoning": reasoning + [f"Refranation: {perfection['reason']}"] ,
                 "timing": None,
                 "traditional_factors": {
                     "perfection_type": "refranation",
-                    "querent_strength": chart.planets[querent_planet].dignity_score,
-                    "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                    "querent_strength": querent_strength,
+                    "quesited_strength": quesited_strength,
                     "reception": self._detect_reception_between_planets(chart, primary_significator, secondary_significator),
-                },
+                } if detailed else {},
                 "solar_factors": solar_factors,
             }
 
@@ -1679,8 +1875,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         "perfection_type": "frustration",
                         "frustrating_planet": frustration_result["frustrating_planet"].value,
                         "reception": frustration_result.get("reception", "none"),
-                        "querent_strength": chart.planets[querent_planet].dignity_score,
-                        "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                        "querent_strength": querent_strength,
+                        "quesited_strength": quesited_strength,
                     },
                     "solar_factors": solar_factors,
                 }
@@ -1703,7 +1899,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if perfection.get("perfects"):
             moon_next_aspect_result["decisive"] = False
 
-        sun_to_10th = self._check_sun_applying_to_10th_ruler(chart)
+        sun_to_10th = self._check_sun_applying_to_10th_ruler(chart, ignore_combustion)
         if sun_to_10th:
             reasoning.append("Sun applying to 10th ruler - result/recognition revealed soon")
             confidence = min(100, confidence + 2)
@@ -1720,32 +1916,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             )
 
             # Incorporate Moon's next aspect testimony before other penalties
-            if moon_next_aspect_result.get("result"):
-                new_conf = min(
-                    confidence, moon_next_aspect_result.get("confidence", confidence)
-                )
-                weight = int(new_conf - confidence)
-                if moon_next_aspect_result.get("result") == "NO":
-                    reasoning.append(
-                        f"Moon's next aspect denies perfection: {moon_next_aspect_result['reason']} ({weight})"
-                    )
-                else:
-                    reasoning.append(
-                        f"Moon's next aspect supports but cannot perfect: {moon_next_aspect_result['reason']} ({weight})"
-                    )
-                confidence = new_conf
-
-            if moon_next_aspect_result.get("decisive"):
-                reasoning.append("FLAG: MOON_NEXT_DECISIVE")
-
-            # CRITICAL FIX 2: Apply retrograde quesited penalty early so bonuses can offset it
-            confidence = self._apply_retrograde_quesited_penalty(
-                confidence, chart, quesited_planet, reasoning
-            )
+            confidence = self._apply_moon_next_aspect(confidence, moon_next_aspect_result, reasoning)
 
-            # CRITICAL FIX 3: Apply dignity-based confidence adjustment (can mitigate retrograde)
-            confidence = self._apply_dignity_confidence_adjustment(
-                confidence, chart, querent_planet, quesited_planet, reasoning
+            # CRITICAL FIX 2/3: Retrograde quesited penalty, then dignity-based
+            # adjustment so strong dignities can offset it
+            confidence = self._apply_significator_condition_adjustments(
+                confidence, chart, querent_planet, quesited_planet, reasoning, config
             )
 
             if (
@@ -1770,12 +1946,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
             # Apply debilitated ruler and cadent significator penalties
             confidence = self._apply_debilitation_and_cadent_penalties(
-                confidence, chart, querent_planet, quesited_planet, reasoning
+                confidence, chart, querent_planet, quesited_planet, reasoning, config
             )
 
             # Apply timing decay based on perfection timing
             confidence = int(
-                self._apply_timing_decay(confidence, perfection.get("t_perfect_days"))
+                self._apply_timing_decay(confidence, perfection.get("t_perfect_days"), config)
             )
 
             # CRITICAL FIX 4: Apply confidence threshold (FIXED - low confidence should be NO/INCONCLUSIVE)
@@ -1794,8 +1970,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "traditional_factors": {
                     "perfection_type": perfection["type"],
                     "reception": perfection.get("reception", "none"),
-                    "querent_strength": chart.planets[querent_planet].dignity_score,
-                    "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                    "querent_strength": querent_strength,
+                    "quesited_strength": quesited_strength,
                 },
                 "solar_factors": solar_factors,
             }
@@ -1821,8 +1997,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     "perfection_type": "blocked",
                     "blockers": blocker_eval["blockers"],
                     "reception": "none",
-                    "querent_strength": chart.planets[querent_planet].dignity_score,
-                    "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                    "querent_strength": querent_strength,
+                    "quesited_strength": quesited_strength,
                 },
                 "solar_factors": solar_factors,
             }
@@ -1846,10 +2022,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 prohibitions.append("Shared significator severely debilitated")
             
             # Check for combustion (if not ignored)
-            if not ignore_combustion and any(
-                analysis.condition in ["Combustion", "Under the Beams"] 
-                for analysis in solar_factors.get("detailed_analyses", {}).values() 
-                if analysis["planet"] == shared_planet
+            shared_analysis = solar_factors.get("detailed_analyses", {}).get(shared_planet.value)
+            if (
+                not ignore_combustion
+                and shared_analysis
+                and shared_analysis.get("condition") in _SOLAR_IMPEDIMENT_NAMES
             ):
                 prohibitions.append("Shared significator combust/under beams")
             
@@ -1882,7 +2059,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     reasoning.append("Same ruler unity indicates direct perfection")
             
             # Get Moon testimony for confidence modification (not decisive)
-            moon_testimony = self._check_enhanced_moon_testimony(chart, querent_planet, quesited_planet, ignore_void_moon)
+            moon_testimony = self._check_enhanced_moon_testimony(chart, querent_planet, quesited_planet, ignore_void_moon, config)
             
             # FIXED: Detect conflicting testimonies and adjust confidence
             reception = self._detect_reception_between_planets(chart, querent_planet, quesited_planet)
@@ -1899,15 +2076,10 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if has_reception:
                 positive_testimonies.append(f"reception ({reception})")
             
-            # Analyze Moon aspects for conflicts
-            if moon_testimony.get("aspects"):
-                favorable_aspects = [a for a in moon_testimony["aspects"] if a.get("favorable")]
-                unfavorable_aspects = [a for a in moon_testimony["aspects"] if not a.get("favorable")]
-                
-                if favorable_aspects:
-                    positive_testimonies.extend([a["description"] for a in favorable_aspects])
-                if unfavorable_aspects:
-                    negative_testimonies.extend([a["description"] for a in unfavorable_aspects])
+            # Analyze Moon aspects for conflicts, partitioning them in one pass
+            for aspect_info in moon_testimony.get("aspects") or ():
+                testimonies = positive_testimonies if aspect_info.get("favorable") else negative_testimonies
+                testimonies.append(aspect_info["description"])
             
             # Calculate confidence based on testimony balance
             if positive_testimonies and negative_testimonies:
@@ -1928,20 +2100,17 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 reasoning.append(f"Reception supports perfection: {reception}")
             
             # FIXED: Check Moon's dual roles (house ruler vs co-significator)
-            moon_house_roles = []
-            for house_num, ruler in chart.house_rulers.items():
-                if ruler == Planet.MOON:
-                    moon_house_roles.append(house_num)
+            moon_house_roles = chart.houses_by_ruler.get(Planet.MOON, ())
             
             if moon_house_roles:
-                relevant_moon_roles = []
-                for house in moon_house_roles:
-                    if house in [1, 2, 7, 8, 10, 11]:  # Houses potentially relevant to financial/approval questions
-                        relevant_moon_roles.append(house)
+                # Houses potentially relevant to financial/approval questions
+                relevant_moon_roles = [
+                    house for house in moon_house_roles if (_MOON_ROLE_MASK >> house) & 1
+                ]
                 
                 if relevant_moon_roles:
                     # Moon as house ruler should be analyzed separately from general testimony
-                    moon_as_ruler_condition = chart.planets[Planet.MOON]
+                    moon_as_ruler_condition = chart.moon
                     
                     if moon_as_ruler_condition.dignity_score >= 0:
                         base_confidence = min(88, base_confidence + 3)
@@ -1963,7 +2132,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "timing": timing,
                 "traditional_factors": {
                     "perfection_type": "same_ruler_unity",
-                    "reception": self._detect_reception_between_planets(chart, querent_planet, quesited_planet),
+                    "reception": reception,
                     "querent_strength": shared_position.dignity_score,
                     "quesited_strength": shared_position.dignity_score,  # Same ruler = same strength
                     "moon_void": moon_testimony.get("void_of_course", False)
@@ -1972,29 +2141,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             }
         
         # 3.6. PRIORITY: Moon's next applying aspect to significators (traditional key indicator)
-        if moon_next_aspect_result.get("result"):
-            new_conf = min(
-                confidence, moon_next_aspect_result.get("confidence", confidence)
-            )
-            weight = int(new_conf - confidence)
-            if moon_next_aspect_result.get("result") == "NO":
-                reasoning.append(
-                    f"Moon's next aspect denies perfection: {moon_next_aspect_result['reason']} ({weight})"
-                )
-            else:
-                reasoning.append(
-                    f"Moon's next aspect supports but cannot perfect: {moon_next_aspect_result['reason']} ({weight})"
-                )
-            confidence = new_conf
-
-        if moon_next_aspect_result.get("decisive"):
-            reasoning.append("FLAG: MOON_NEXT_DECISIVE")
+        confidence = self._apply_moon_next_aspect(confidence, moon_next_aspect_result, reasoning)
         
         # 3.7. Enhanced Moon testimony analysis when no decisive Moon aspect
-        moon_testimony = self._check_enhanced_moon_testimony(chart, querent_planet, quesited_planet, ignore_void_moon)
+        moon_testimony = self._check_enhanced_moon_testimony(chart, querent_planet, quesited_planet, ignore_void_moon, config)
         
         # 4. Enhanced denial conditions (retrograde now configurable)
-        denial = self._check_enhanced_denial_conditions(chart, querent_planet, quesited_planet)
+        denial = self._check_enhanced_denial_conditions(chart, querent_planet, quesited_planet, config)
         if denial["denied"]:
             return {
                 "result": "NO",
@@ -2023,8 +2176,6 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         if benefic_support["favorable"]:
             # ROOT FIX: Add significator weakness assessment to benefic support logic
-            quesited_pos = chart.planets[quesited_planet]
-
             # Check if quesited is severely debilitated
             if quesited_pos.dignity_score <= -4 or quesited_pos.retrograde:
                 # Severely weak quesited overrides benefic support
@@ -2080,8 +2231,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     "traditional_factors": {
                         "perfection_type": "pregnancy_sufficiency",
                         "reception": reception,
-                        "querent_strength": chart.planets[querent_planet].dignity_score,
-                        "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                        "querent_strength": querent_strength,
+                        "quesited_strength": quesited_strength,
                         "moon_benefic": has_moon_benefic
                     },
                     "solar_factors": solar_factors
@@ -2094,7 +2245,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         supportive_signals = []
         
         # Reception support
-        reception_info = self.reception_calculator.calculate_comprehensive_reception(
+        reception_info = self._cached_reception(
             chart, querent_planet, quesited_planet
         )
         mutual = reception_info.get("mutual", "none")
@@ -2116,7 +2267,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             # Check if Moon aspects significator or in education context, L10 ruler
             target = moon_next_aspect.planet
             if target in [querent_planet, quesited_planet]:
-                if moon_next_aspect.aspect in [Aspect.TRINE, Aspect.SEXTILE]:
+                if moon_next_aspect.aspect in _SOFT_ASPECTS:
                     moon_bonus = 8  # Standard Moon aspect bonus
                     moon_display = f"Moon {moon_next_aspect.aspect.display_name} {target.value} (applying)"
                     supportive_signals.append(f"{moon_display} (+{moon_bonus})")
@@ -2128,8 +2279,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             strongest = benefic_support.get("strongest_aspect")
             if strongest:
                 # Check if this aspect should actually be negative under enhanced scoring
-                aspect_desc = strongest.get("description", "")
-                if "☍" in aspect_desc or "□" in aspect_desc:  # Opposition or square
+                if strongest.get("aspect") in _HARD_ASPECT_VALUES:  # Opposition or square
                     # These should be negative under enhanced policy, don't include as supportive
                     pass
                 else:
@@ -2151,7 +2301,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         # Apply debilitated ruler and cadent penalties to final confidence
         final_confidence = self._apply_debilitation_and_cadent_penalties(
-            final_confidence, chart, querent_planet, quesited_planet, reasoning
+            final_confidence, chart, querent_planet, quesited_planet, reasoning, config
         )
 
         return {
@@ -2161,8 +2311,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "timing": None,
             "traditional_factors": {
                 "perfection_type": "none",
-                "querent_strength": chart.planets[querent_planet].dignity_score,
-                "quesited_strength": chart.planets[quesited_planet].dignity_score,
+                "querent_strength": querent_strength,
+                "quesited_strength": quesited_strength,
                 "reception": self._detect_reception_between_planets(chart, querent_planet, quesited_planet),
                 "benefic_noted": benefic_support.get("total_score", 0) > 0
             },
@@ -2171,44 +2321,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         }
     
     
-    def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
+    def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                          config=None) -> Dict[str, Any]:
         """Enhanced denial conditions with configurable retrograde handling"""
         
-        config = cfg()
-        
-        # Traditional Frustration - any planet can aspect a significator first
-        frustration_result = self._check_frustration(chart, querent, quesited)
-        if frustration_result["found"]:
-            return {
-                "denied": True,
-                "confidence": frustration_result["confidence"],
-                "reason": frustration_result["reason"]
-            }
-        
-        # Enhanced retrograde handling - configurable instead of automatic denial
-        querent_pos = chart.planets[querent]
-        quesited_pos = chart.planets[quesited]
-        
-        if not config.retrograde.automatic_denial:
-            # Retrograde is now just a penalty, not automatic denial
-            if querent_pos.retrograde or quesited_pos.retrograde:
-                # This will be handled in dignity scoring instead
-                pass
-        else:
-            # Legacy behavior - automatic denial
-            if querent_pos.retrograde or quesited_pos.retrograde:
-                return {
-                    "denied": True,
-                    "confidence": config.confidence.denial.frustration_retrograde,
-                    "reason": f"Frustration - {'querent' if querent_pos.retrograde else 'quesited'} significator retrograde"
-                }
-        
-        return {"denied": False}
-
-    def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
-        """Enhanced denial conditions with configurable retrograde handling"""
-        
-        config = cfg()
+        config = config or cfg()
         
         # Traditional Frustration - any planet can aspect a significator first
         frustration_result = self._check_frustration(chart, querent, quesited)
@@ -2259,7 +2376,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 travel_warnings.append("Querent in 8th house (danger/trouble)")
             
             # Moon in 6th house - health problems
-            moon_pos = chart.planets[Planet.MOON]
+            moon_pos = chart.moon
             if moon_pos.house == 6:
                 travel_warnings.append("Moon in 6th house (health concerns)")
             
@@ -2295,56 +2412,75 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 
         return confidence
     
-    def _apply_dignity_confidence_adjustment(self, confidence: float, chart: HoraryChart, 
-                                          querent: Planet, quesited: Planet, reasoning: List[str]) -> float:
-        """CRITICAL FIX 2: Adjust confidence based on significator dignities"""
+    def _apply_significator_condition_adjustments(self, confidence: float, chart: HoraryChart,
+                                                  querent: Planet, quesited: Planet, reasoning: List[str],
+                                                  config=None) -> float:
+        """CRITICAL FIX 2/3: Adjust confidence for a retrograde quesited and significator dignities"""
         
+        quesited_pos = chart.planets[quesited]
         querent_dignity = chart.planets[querent].dignity_score
-        quesited_dignity = chart.planets[quesited].dignity_score
+        quesited_dignity = quesited_pos.dignity_score
         
-        # Quesited dignity is most critical for success
-        if quesited_dignity <= -10:
-            # Severely debilitated quesited = very unlikely success
-            penalty = 35
+        if quesited_pos.retrograde:
+            # Retrograde quesited = turning away, obstacles, delays
+            penalty = getattr((config or cfg()).retrograde, "quesited_penalty", 12)
             confidence = max(confidence - penalty, 10)
-            reasoning.append(f"Severely weak quesited ({quesited_dignity}): -{penalty}%")
-        elif quesited_dignity < -5:
-            # Moderately debilitated quesited
-            penalty = 20
-            confidence = max(confidence - penalty, 25)
-            reasoning.append(f"Weak quesited dignity ({quesited_dignity}): -{penalty}%")
-        elif quesited_dignity >= 10:
-            # Very strong quesited
-            bonus = 15
-            confidence = min(confidence + bonus, 95)
-            reasoning.append(f"Strong quesited dignity ({quesited_dignity}): +{bonus}%")
+            reasoning.append(f"Retrograde quesited: -{penalty}% (turning away from success)")
+        
+        # Quesited dignity is most critical for success: severely debilitated
+        # (<= -10), debilitated (< -5), neutral or very strong (>= 10)
+        band = (quesited_dignity > -10) + (quesited_dignity >= -5) + (quesited_dignity >= 10)
+        delta, floor, ceiling, reason = _QUESITED_DIGNITY_BANDS[band]
+        confidence = min(max(confidence + delta, floor), ceiling)
+        if reason:
+            reasoning.append(reason.format(quesited_dignity))
             
         # Querent dignity affects confidence but less critically
-        if querent_dignity <= -10:
-            penalty = 15
-            confidence = max(confidence - penalty, 5)
-            reasoning.append(f"Weak querent dignity ({querent_dignity}): -{penalty}%")
-        elif querent_dignity >= 10:
-            bonus = 10
-            confidence = min(confidence + bonus, 95)
-            reasoning.append(f"Strong querent dignity ({querent_dignity}): +{bonus}%")
+        band = (querent_dignity > -10) + (querent_dignity >= 10)
+        delta, floor, ceiling, reason = _QUERENT_DIGNITY_BANDS[band]
+        confidence = min(max(confidence + delta, floor), ceiling)
+        if reason:
+            reasoning.append(reason.format(querent_dignity))
             
         return confidence
     
-    def _apply_retrograde_quesited_penalty(self, confidence: float, chart: HoraryChart,
-                                         quesited: Planet, reasoning: List[str]) -> float:
-        """CRITICAL FIX 2: Apply penalty for retrograde quesited"""
+    def _apply_moon_next_aspect(self, confidence: float, moon_next_aspect_result: Dict[str, Any],
+                                reasoning: List[str]) -> float:
+        """Cap confidence by the Moon's next aspect testimony and note it in reasoning"""
+        result = moon_next_aspect_result.get("result")
+        if result:
+            new_conf = min(
+                confidence, moon_next_aspect_result.get("confidence", confidence)
+            )
+            weight = int(new_conf - confidence)
+            if result == "NO":
+                reasoning.append(
+                    f"Moon's next aspect denies perfection: {moon_next_aspect_result['reason']} ({weight})"
+                )
+            else:
+                reasoning.append(
+                    f"Moon's next aspect supports but cannot perfect: {moon_next_aspect_result['reason']} ({weight})"
+                )
+            confidence = new_conf
 
-        config = cfg()
-        quesited_pos = chart.planets[quesited]
-        if quesited_pos.retrograde:
-            # Retrograde quesited = turning away, obstacles, delays
-            penalty = getattr(config.retrograde, "quesited_penalty", 12)
-            confidence = max(confidence - penalty, 10)
-            reasoning.append(f"Retrograde quesited: -{penalty}% (turning away from success)")
+        if moon_next_aspect_result.get("decisive"):
+            reasoning.append("FLAG: MOON_NEXT_DECISIVE")
 
         return confidence
 
+    def _planet_angularity(self, chart: HoraryChart, planet: Planet) -> str:
+        """Traditional angularity of a chart planet, memoized on the chart"""
+        cached = chart._angularity
+        if cached is None:
+            cached = chart._angularity = {}
+        angularity = cached.get(planet)
+        if angularity is None:
+            pos = chart.planets[planet]
+            angularity = cached[planet] = self.calculator._get_traditional_angularity(
+                pos.longitude, chart.houses, pos.house
+            )
+        return angularity
+
     def _apply_debilitation_and_cadent_penalties(
         self,
         confidence: float,
@@ -2352,10 +2488,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         querent: Planet,
         quesited: Planet,
         reasoning: List[str],
+        config=None,
     ) -> float:
         """Apply penalties for debilitated L2/L11 and cadent significators."""
 
-        penalties = getattr(cfg(), "debilitation_penalties", None)
+        penalties = getattr(config or cfg(), "debilitation_penalties", None)
         if not penalties:
             return confidence
 
@@ -2383,23 +2520,19 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         cadent_penalty = getattr(penalties, "cadent_significator", 0)
         for planet in [querent, quesited]:
-            pos = chart.planets.get(planet)
-            if pos:
-                angularity = self.calculator._get_traditional_angularity(
-                    pos.longitude, chart.houses, pos.house
+            if planet in chart.planets and self._planet_angularity(chart, planet) == "cadent":
+                confidence = max(confidence - cadent_penalty, 0)
+                reasoning.append(
+                    f"{planet.value} in cadent house (-{cadent_penalty}%)"
                 )
-                if angularity == "cadent":
-                    confidence = max(confidence - cadent_penalty, 0)
-                    reasoning.append(
-                        f"{planet.value} in cadent house (-{cadent_penalty}%)"
-                    )
 
         return confidence
 
-    def _apply_timing_decay(self, confidence: float, t_perfect_days: Optional[float]) -> float:
+    def _apply_timing_decay(self, confidence: float, t_perfect_days: Optional[float],
+                            config=None) -> float:
         """Apply confidence decay for long perfection timeframes."""
 
-        decay_cfg = getattr(getattr(cfg(), "timing", {}), "decay", None)
+        decay_cfg = getattr(getattr(config or cfg(), "timing", {}), "decay", None)
         if not decay_cfg or t_perfect_days is None:
             return confidence
 
@@ -2409,11 +2542,31 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             return confidence * getattr(decay_cfg, "medium_factor", 1.0)
         return confidence
     
-    def _check_enhanced_translation_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
+    def _check_enhanced_translation_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                             config=None, ignore_combustion: bool = False) -> Dict[str, Any]:
         """Traditional translation of light with comprehensive validation requirements"""
         
-        config = cfg()
+        config = config or cfg()
         translation_cfg = getattr(config, "translation", SimpleNamespace())
+        require_speed_advantage = getattr(translation_cfg, "require_speed_advantage", False)
+        require_proper_sequence = getattr(translation_cfg, "require_proper_sequence", False)
+        
+        # Significator speeds are the same for every candidate translator
+        querent_speed = abs(chart.planets[querent].speed)
+        quesited_speed = abs(chart.planets[quesited].speed)
+        max_significator_speed = max(querent_speed, quesited_speed)
+        
+        # With a required speed advantage, nothing can translate unless some
+        # other planet outpaces both significators
+        if require_speed_advantage and not any(
+            abs(pos.speed) > max_significator_speed
+            for planet, pos in chart.planets.items()
+            if planet is not querent and planet is not quesited
+        ):
+            return {"found": False}
+        
+        # Only aspects within moiety-based orb limits count
+        aspects_within_orb = self._aspects_within_orb_by_planet(chart)
 
         # Check all planets as potential translators (traditionally Moon, but allow all)
         for planet, pos in chart.planets.items():
@@ -2421,33 +2574,21 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue
             
             # TRADITIONAL REQUIREMENT 1: Translator speed validation
-            querent_pos = chart.planets[querent]
-            quesited_pos = chart.planets[quesited]
+            translator_speed = abs(pos.speed)
             
             # Enhanced speed requirement - translator must be faster than both significators
-            if getattr(translation_cfg, "require_speed_advantage", False):
-                translator_speed = abs(pos.speed)
-                querent_speed = abs(querent_pos.speed)
-                quesited_speed = abs(quesited_pos.speed)
-                
-                # Strict speed validation: translator must be faster than both
-                if not (translator_speed > querent_speed and translator_speed > quesited_speed):
-                    continue
+            if require_speed_advantage and not translator_speed > max_significator_speed:
+                continue
             
             # TRADITIONAL REQUIREMENT 2: Find valid aspects between translator and significators with orb validation
             querent_aspect = None
             quesited_aspect = None
             
-            for aspect in chart.aspects:
-                # Check orb limits using moiety-based calculation
-                if not self._is_aspect_within_orb_limits(chart, aspect):
-                    continue  # Skip aspects that exceed proper orb limits
-                
-                if ((aspect.planet1 == planet and aspect.planet2 == querent) or
-                    (aspect.planet1 == querent and aspect.planet2 == planet)):
+            for aspect in aspects_within_orb.get(planet, ()):
+                other = aspect.planet2 if aspect.planet1 == planet else aspect.planet1
+                if other == querent:
                     querent_aspect = aspect
-                elif ((aspect.planet1 == planet and aspect.planet2 == quesited) or
-                      (aspect.planet1 == quesited and aspect.planet2 == planet)):
+                elif other == quesited:
                     quesited_aspect = aspect
             
             # TRADITIONAL REQUIREMENT 2: Must have aspects to both significators
@@ -2483,7 +2624,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
             # ENHANCED REQUIREMENT 4: Check for IMMEDIATE SEQUENCE (no intervening aspects)
             sequence_note = ""
-            if getattr(translation_cfg, "require_proper_sequence", False):
+            if require_proper_sequence:
                 intervening_aspects = self._check_intervening_aspects(chart, planet, separating_aspect, applying_aspect)
                 if intervening_aspects:
                     continue  # Translation invalid if other aspects intervene
@@ -2491,8 +2632,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     sequence_note = " (immediate sequence)"
             
             # TRADITIONAL REQUIREMENT 5: Check reception with translator using centralized calculator
-            reception_querent_data = self.reception_calculator.calculate_comprehensive_reception(chart, planet, querent)
-            reception_quesited_data = self.reception_calculator.calculate_comprehensive_reception(chart, planet, quesited)
+            reception_querent_data = self._cached_reception(chart, planet, querent)
+            reception_quesited_data = self._cached_reception(chart, planet, quesited)
             
             reception_with_querent = reception_querent_data["type"] != "none"
             reception_with_quesited = reception_quesited_data["type"] != "none"
@@ -2517,15 +2658,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             # Traditional rule: Even combust planets can translate light
             # but with reduced effectiveness
             combustion_penalty = 0
-            if hasattr(pos, 'solar_condition') and pos.solar_condition.condition == "Combustion":
+            if planet in chart.combust_planets and not ignore_combustion:
                 combustion_penalty = 15
                 confidence -= combustion_penalty
                 
             # Assess favorability based on aspect quality and translator condition
             favorable = True
             negative_reasons = []
-            hard = {Aspect.SQUARE, Aspect.OPPOSITION}
-            if (querent_aspect.aspect in hard) or (quesited_aspect.aspect in hard):
+            if (querent_aspect.aspect in _HARD_ASPECTS) or (quesited_aspect.aspect in _HARD_ASPECTS):
                 favorable = False  # Hard aspects make translation strained
                 confidence -= 5
                 negative_reasons.append("hard aspect")
@@ -2533,14 +2673,10 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 negative_reasons.append("translator combust")
             
             # Calculate validation metrics for transparency
-            translator_speed = abs(pos.speed)
-            querent_speed = abs(querent_pos.speed)
-            quesited_speed = abs(quesited_pos.speed)
-            
             separating_orb = separating_aspect.orb
             applying_orb = applying_aspect.orb
-            separating_planet_name = querent.value if separating_aspect == querent_aspect else quesited.value
-            applying_planet_name = quesited.value if applying_aspect == quesited_aspect else querent.value
+            separating_planet_name = querent.value if separating_aspect is querent_aspect else quesited.value
+            applying_planet_name = quesited.value if applying_aspect is quesited_aspect else querent.value
             
             return {
                 "found": True,
@@ -2556,7 +2692,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "combustion_penalty": combustion_penalty,
                 "negative_reasons": negative_reasons,
                 "validation_details": {
-                    "speed_validated": translator_speed > max(querent_speed, quesited_speed),
+                    "speed_validated": translator_speed > max_significator_speed,
                     "translator_speed": translator_speed,
                     "significator_speeds": {"querent": querent_speed, "quesited": quesited_speed},
                     "orb_validation": {
@@ -2567,13 +2703,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         "orbs_within_limits": True  # We already validated this above
                     },
                     "sequence_validated": True,  # We already validated timing above
-                    "intervening_aspects_checked": getattr(translation_cfg, "require_proper_sequence", False)
+                    "intervening_aspects_checked": require_proper_sequence
                 }
             }
         
         return {"found": False}
     
-    def _check_transaction_translation(self, chart: HoraryChart, seller: Planet, buyer: Planet, item: Planet) -> Dict[str, Any]:
+    def _check_transaction_translation(self, chart: HoraryChart, seller: Planet, buyer: Planet, item: Planet,
+                                       ignore_combustion: bool = False) -> Dict[str, Any]:
         """Check for translation involving transaction (seller, buyer, item) - matches reference analysis"""
         
         # Reference: Mercury translated light between Mars (buyer) and Sun (car)
@@ -2584,16 +2721,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 continue
             
             # Find aspects involving the translator
-            translator_aspects = []
-            for aspect in chart.aspects:
-                if aspect.planet1 == translator_planet or aspect.planet2 == translator_planet:
-                    other_planet = aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1
-                    translator_aspects.append({
-                        "other": other_planet,
-                        "aspect": aspect,
-                        "applying": aspect.applying,
-                        "degrees_to_exact": aspect.degrees_to_exact
-                    })
+            translator_aspects = [
+                {
+                    "other": aspect.planet2 if aspect.planet1 == translator_planet else aspect.planet1,
+                    "aspect": aspect,
+                    "applying": aspect.applying,
+                    "degrees_to_exact": aspect.degrees_to_exact
+                }
+                for aspect in chart.aspects_by_planet.get(translator_planet, ())
+            ]
             
             # Check for transaction translation patterns:
             # Pattern 1: Translator separates from item, applies to seller/buyer
@@ -2610,7 +2746,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         confidence = 75
                         
                         # Reduce confidence if translator is combust
-                        if hasattr(pos, 'solar_condition') and pos.solar_condition.condition == "Combustion":
+                        if translator_planet in chart.combust_planets and not ignore_combustion:
                             confidence -= 10
                         
                         party_name = "seller" if party_aspect["other"] == seller else "buyer"
@@ -2625,7 +2761,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     elif (not party_aspect["applying"] and item_aspect["applying"]):
                         confidence = 75
                         
-                        if hasattr(pos, 'solar_condition') and pos.solar_condition.condition == "Combustion":
+                        if translator_planet in chart.combust_planets and not ignore_combustion:
                             confidence -= 10
                             
                         party_name = "seller" if party_aspect["other"] == seller else "buyer"
@@ -2641,11 +2777,26 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         return {"found": False}
     
     def _check_enhanced_moon_testimony(self, chart: HoraryChart, querent: Planet, quesited: Planet,
-                                     ignore_void_moon: bool = False) -> Dict[str, Any]:
+                                     ignore_void_moon: bool = False, config=None) -> Dict[str, Any]:
+        """Enhanced Moon testimony, memoized on the chart (per configuration)"""
+        config = config or cfg()
+        if chart._moon_testimony_cache is None or chart._moon_testimony_cache[0] is not config:
+            chart._moon_testimony_cache = (config, {})
+        cached = chart._moon_testimony_cache[1]
+        key = (querent, quesited, ignore_void_moon)
+        testimony = cached.get(key)
+        if testimony is None:
+            testimony = cached[key] = self._evaluate_moon_testimony(
+                chart, querent, quesited, ignore_void_moon, config
+            )
+        return testimony
+    
+    def _evaluate_moon_testimony(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                 ignore_void_moon: bool = False, config=None) -> Dict[str, Any]:
         """Enhanced Moon testimony using the traditional void-of-course rule"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        moon_pos = chart.moon
+        config = config or cfg()
         
         # ENHANCED: Check if Moon is void of course - now cautionary, not absolute blocker
         void_of_course = False
@@ -2659,9 +2810,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # ENHANCED: Continue with Moon analysis even if void (traditional cautionary approach)
         # Enhanced Moon analysis with accidental dignities
-        phase_bonus = self._moon_phase_bonus(chart)
-        speed_bonus = self._moon_speed_bonus(chart)
-        angularity_bonus = self._moon_angularity_bonus(chart)
+        phase_bonus = self._moon_phase_bonus(chart, config)
+        speed_bonus = self._moon_speed_bonus(chart, config)
+        angularity_bonus = self._moon_angularity_bonus(chart, config)
         
         total_moon_bonus = phase_bonus + speed_bonus + angularity_bonus
         adjusted_dignity = moon_pos.dignity_score + total_moon_bonus
@@ -2670,11 +2821,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         moon_significator_aspects = []
         
         # Find quesited house number for planets-in-house testimony
-        quesited_house_number = None
-        for house_num, ruler in chart.house_rulers.items():
-            if ruler == quesited:
-                quesited_house_number = house_num
-                break
+        quesited_house_number = next(iter(chart.houses_by_ruler.get(quesited, ())), None)
         
         # Check all current Moon aspects
         for aspect in chart.aspects:
@@ -2689,12 +2836,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         house_role = "querent (L1)"
                     elif other_planet == quesited:
                         # Find which house this quesited planet rules
-                        for house, ruler in chart.house_rulers.items():
-                            if ruler == other_planet:
-                                house_role = f"L{house}"
-                                break
-                        if not house_role:
-                            house_role = "quesited"
+                        ruled_houses = chart.houses_by_ruler.get(other_planet)
+                        house_role = f"L{ruled_houses[0]}" if ruled_houses else "quesited"
                     
                     favorable = aspect.aspect in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
                     aspect_desc = self._format_aspect_for_display("Moon", aspect.aspect.value, other_planet.value, aspect.applying)
@@ -2902,11 +3045,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         significators = [querent_planet, quesited_planet]
 
         # Determine which house the quesited planet rules
-        quesited_house_number = None
-        for house_num, ruler in chart.house_rulers.items():
-            if ruler == quesited_planet:
-                quesited_house_number = house_num
-                break
+        quesited_house_number = next(iter(chart.houses_by_ruler.get(quesited_planet, ())), None)
 
         benefic_aspects = []
         total_score = 0
@@ -2969,9 +3108,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 benefic_pos = chart.planets[benefic]
                 if benefic_pos.house == quesited_house_number:
                     strength = 0
-                    if benefic_pos.house in [1, 4, 7, 10]:
+                    if (_ANGULAR_MASK >> benefic_pos.house) & 1:
                         strength += 4
-                    elif benefic_pos.house in [2, 5, 8, 11]:
+                    elif (_SUCCEDENT_MASK >> benefic_pos.house) & 1:
                         strength += 2
                     else:
                         strength += 1
@@ -2981,7 +3120,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
                     if strength > 0:
                         desc = f"{benefic.value} in {quesited_house_number}th house"
-                        if benefic_pos.house in [1, 4, 7, 10]:
+                        if (_ANGULAR_MASK >> benefic_pos.house) & 1:
                             desc += " (angular)"
                         if benefic_pos.dignity_score > 0:
                             desc += f" ({benefic_pos.dignity_score:+d} dignity)"
@@ -3096,9 +3235,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 
         # House position bonus (only for positive aspects)
         if base_strength > 0:
-            if benefic_pos.house in [1, 4, 7, 10]:
+            if (_ANGULAR_MASK >> benefic_pos.house) & 1:
                 base_strength += 2  # Reduced angular bonus
-            elif benefic_pos.house in [2, 5, 8, 11]:
+            elif (_SUCCEDENT_MASK >> benefic_pos.house) & 1:
                 base_strength += 1  # Reduced succeedent bonus
                 
         # Benefic planet bonuses (only for positive aspects)
@@ -3116,7 +3255,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _get_reception_strength(self, planet1: Planet, planet2: Planet, chart: HoraryChart) -> int:
         """Get numerical reception strength between two planets"""
-        reception_calc = self.reception_calculator.calculate_comprehensive_reception(chart, planet1, planet2)
+        reception_calc = self._cached_reception(chart, planet1, planet2)
         return reception_calc.get("traditional_strength", 0)
     
     def _is_moon_void_of_course_enhanced(self, chart: HoraryChart) -> Dict[str, Any]:
@@ -3126,9 +3265,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         to any of the seven classical planets (Sun, Mercury, Venus, Mars, Jupiter, Saturn) 
         by a Ptolemaic aspect (conjunction, sextile, square, trine, opposition) within the 
         permitted orb, considering true motion (including retrograde).
+        
+        The result is memoized on the chart (per configuration), as judgment,
+        general info and considerations all consult it.
         """
+        config = cfg()
+        cached = chart._void_cache
+        if cached is not None and cached[0] is config:
+            return cached[1]
         
-        return self._void_traditional_ground_truth(chart)
+        result = self._void_traditional_ground_truth(chart)
+        chart._void_cache = (config, result)
+        return result
     
     def _void_traditional_ground_truth(self, chart: HoraryChart) -> Dict[str, Any]:
         """GROUND TRUTH: Traditional void of course implementation
@@ -3136,7 +3284,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         Moon is void if it will not apply to any classical planet by Ptolemaic aspect
         within permitted orb before leaving its current sign.
         """
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
         config = cfg()
 
         # Calculate degrees and days left in current sign
@@ -3264,11 +3412,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return positions
     
-    def _build_moon_story(self, chart: HoraryChart) -> List[Dict]:
+    def _build_moon_story(self, chart: HoraryChart, config=None) -> List[Dict]:
         """Enhanced Moon story with real timing calculations"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
+        moon_pos = chart.moon
+        max_future_days = (config or cfg()).timing.max_future_days
         
         # Get current aspects
         current_moon_aspects = []
@@ -3284,7 +3432,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         other_pos,
                         aspect.aspect,
                         chart.julian_day,
-                        cfg().timing.max_future_days,
+                        max_future_days,
                     ) or 0
                     timing_estimate = self._format_timing_description_enhanced(timing_days)
                 else:
@@ -3372,10 +3520,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         return None
     
     def _check_enhanced_perfection(self, chart: HoraryChart, querent: Planet, quesited: Planet,
-                                 exaltation_confidence_boost: float = 15.0, window_days: int = None) -> Dict[str, Any]:
+                                 exaltation_confidence_boost: float = 15.0, window_days: int = None,
+                                 config=None, ignore_combustion: bool = False) -> Dict[str, Any]:
         """Enhanced perfection check with configuration"""
         
-        config = cfg()
+        config = config or cfg()
         querent_pos = chart.planets[querent]
         quesited_pos = chart.planets[quesited]
         
@@ -3400,8 +3549,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     other_planet = querent
                 
                 if sun_planet and other_planet:
-                    other_pos = chart.planets[other_planet]
-                    if hasattr(other_pos, 'solar_condition') and other_pos.solar_condition.condition == "Combustion":
+                    if other_planet in chart.combust_planets and not ignore_combustion:
                         is_combustion_conjunction = True
                         return {
                             "perfects": False,
@@ -3421,7 +3569,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     "perfects": False,
                     "type": "refranation",
                     "favorable": False,
-                    "confidence": cfg().confidence.denial.refranation,
+                    "confidence": config.confidence.denial.refranation,
                     "reason": f"{planet} stations before perfecting aspect",
                     "aspect": direct_aspect,
                 }
@@ -3516,7 +3664,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if not direct_aspect_found:
             
             # 3. Enhanced translation of light (only when no direct connection)
-            translation = self._check_enhanced_translation_of_light(chart, querent, quesited)
+            translation = self._check_enhanced_translation_of_light(
+                chart, querent, quesited, config, ignore_combustion
+            )
             if translation and translation.get("found", False):
                 return {
                     "perfects": True,
@@ -3531,7 +3681,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # 4. Enhanced collection of light (only when no direct connection)
         if not direct_aspect_found:
-            collection = self._check_enhanced_collection_of_light(chart, querent, quesited)
+            collection = self._check_enhanced_collection_of_light(chart, querent, quesited, ignore_combustion)
             if collection and collection.get("found", False):
                 return {
                     "perfects": True,
@@ -3577,14 +3727,6 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         moiety_qs = getattr(config.orbs.moieties, quesited.value, self._get_planet_moiety(quesited))
         orb_limit = moiety_q + moiety_qs
 
-        target_angles = {
-            Aspect.CONJUNCTION: 0,
-            Aspect.SEXTILE: 60,
-            Aspect.SQUARE: 90,
-            Aspect.TRINE: 120,
-            Aspect.OPPOSITION: 180,
-        }
-
         alignment_info = None
         
         # First check if there's an existing aspect between significators
@@ -3607,7 +3749,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             ):
                 continue  # Can't have future perfection of same aspect type that's already separating
 
-            target_angle = target_angles[aspect_type]
+            target_angle = _ASPECT_TARGET_DEG[aspect_type]
             delta = (quesited_pos.longitude + target_angle - querent_pos.longitude) % 360.0
             if delta > 180:
                 delta -= 360.0
@@ -3686,7 +3828,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 base_confidence = config.confidence.perfection.direct_basic
 
                 # Bonus for favorable aspects
-                if aspect_type in [Aspect.TRINE, Aspect.SEXTILE]:
+                if aspect_type in _SOFT_ASPECTS:
                     favorable = True
                 elif aspect_type == Aspect.CONJUNCTION:
                     favorable = True  # Generally favorable unless combustion
@@ -3732,15 +3874,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if perfection does not occur within ``max_days``.
         """
 
-        target_angles = {
-            Aspect.CONJUNCTION: 0,
-            Aspect.SEXTILE: 60,
-            Aspect.SQUARE: 90,
-            Aspect.TRINE: 120,
-            Aspect.OPPOSITION: 180,
-        }
-
-        target_angle = target_angles.get(aspect_type)
+        target_angle = _ASPECT_TARGET_DEG.get(aspect_type)
         if target_angle is None:
             return None
 
@@ -3971,7 +4105,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     }
         return None
     
-    def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
+    def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                            ignore_combustion: bool = False) -> Dict[str, Any]:
         """Traditional collection of light following Lilly's rules"""
         
         config = cfg()
@@ -4036,7 +4171,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 negative_reasons.append("weak collector")
 
             # Check if collector is free from major afflictions
-            if hasattr(pos, 'solar_condition') and pos.solar_condition.condition == "Combustion":
+            if planet in chart.combust_planets and not ignore_combustion:
                 base_confidence -= 20  # Combust collector less reliable
                 negative_reasons.append("collector combust")
 
@@ -4098,8 +4233,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
 
         # Significant solar impediments to significators
         if not ignore_combustion:
+            significator_names = (querent.value, quesited.value)
             for analysis in solar_factors.get("detailed_analyses", {}).values():
-                if analysis.get("planet") in [querent.value, quesited.value] and analysis.get("condition") in ["Combustion", "Under the Beams"]:
+                if analysis.get("condition") in _SOLAR_IMPEDIMENT_NAMES and analysis.get("planet") in significator_names:
                     blockers.append({
                         "type": "solar_impediment",
                         "severity": "severe",
@@ -4257,17 +4393,33 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _check_enhanced_mutual_reception(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> str:
         """Enhanced mutual reception check using centralized calculator"""
-        reception_data = self.reception_calculator.calculate_comprehensive_reception(chart, planet1, planet2)
+        reception_data = self._cached_reception(chart, planet1, planet2)
         return reception_data["type"]
     
+    def _cached_reception(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Dict[str, Any]:
+        """Comprehensive reception data, memoized on the chart (per configuration)
+        
+        Callers must not mutate the result.
+        """
+        config = cfg()
+        if chart._reception_cache is None or chart._reception_cache[0] is not config:
+            chart._reception_cache = (config, {})
+        cached = chart._reception_cache[1]
+        key = (planet1, planet2)
+        reception_data = cached.get(key)
+        if reception_data is None:
+            reception_data = cached[key] = self.reception_calculator.calculate_comprehensive_reception(
+                chart, planet1, planet2
+            )
+        return reception_data
+    
     def _detect_reception_between_planets(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> str:
         """CENTRALIZED reception detection using single source of truth"""
-        reception_data = self.reception_calculator.calculate_comprehensive_reception(chart, planet1, planet2)
-        return reception_data["type"]
+        return self._cached_reception(chart, planet1, planet2)["type"]
     
     def _get_reception_for_structured_output(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Dict[str, Any]:
         """Get complete reception data for structured output - prevents contradictions"""
-        reception_data = self.reception_calculator.calculate_comprehensive_reception(chart, planet1, planet2)
+        reception_data = self._cached_reception(chart, planet1, planet2)
         return {
             "mutual": reception_data["mutual"],
             "one_way": reception_data["one_way"],
@@ -4277,7 +4429,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _check_dignified_reception(self, chart: HoraryChart, receiving_planet: Planet, received_planet: Planet) -> bool:
         """Check if receiving_planet has dignified reception of received_planet using centralized calculator"""
-        reception_data = self.reception_calculator.calculate_comprehensive_reception(chart, receiving_planet, received_planet)
+        reception_data = self._cached_reception(chart, receiving_planet, received_planet)
         
         # Check if receiving_planet has dignities over received_planet
         reception_1_to_2 = reception_data["planet1_receives_planet2"]
@@ -4351,7 +4503,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         caps = {"favorable": config.confidence.lunar_confidence_caps.favorable}
         
         if l10_ruler and next_aspect.planet == l10_ruler and next_aspect.applying:
-            if next_aspect.aspect in [Aspect.TRINE, Aspect.SEXTILE]:
+            if next_aspect.aspect in _SOFT_ASPECTS:
                 l10_bonus = getattr(config.confidence.moon, "to_house_10_bonus", 8)
                 cap_lift = getattr(config.confidence.moon, "to_house_10_cap_lift", 5)
                 base_confidence += l10_bonus
@@ -4392,14 +4544,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "void_moon": void_of_course
         }
 
-    def _check_sun_applying_to_10th_ruler(self, chart: HoraryChart) -> Optional[Dict[str, Any]]:
+    def _check_sun_applying_to_10th_ruler(self, chart: HoraryChart,
+                                          ignore_combustion: bool = False) -> Optional[Dict[str, Any]]:
         """Detect if the Sun applies to the 10th house ruler within 3°"""
 
         tenth_ruler = chart.house_rulers.get(10)
         if not tenth_ruler:
             return None
 
-        sun_pos = chart.planets[Planet.SUN]
+        sun_pos = chart.sun
         ruler_pos = chart.planets[tenth_ruler]
 
         separation = abs(sun_pos.longitude - ruler_pos.longitude)
@@ -4418,24 +4571,19 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         if future_sep >= separation:
             return None
 
-        combust = False
-        if hasattr(ruler_pos, "solar_condition") and ruler_pos.solar_condition.condition == "Combustion":
-            combust = True
+        combust = tenth_ruler in chart.combust_planets and not ignore_combustion
 
         return {"ruler": tenth_ruler, "combust": combust}
     
     def _format_reception_for_display(self, reception_type: str, planet1: Planet, planet2: Planet, chart: HoraryChart) -> str:
         """Format reception analysis for user-friendly display using centralized calculator"""
-        reception_data = self.reception_calculator.calculate_comprehensive_reception(chart, planet1, planet2)
+        reception_data = self._cached_reception(chart, planet1, planet2)
         return reception_data["display_text"]
     
     def _is_aspect_favorable(self, aspect: Aspect, reception: str) -> bool:
         """Determine if aspect is favorable (preserved)"""
         
-        favorable_aspects = [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-        unfavorable_aspects = [Aspect.SQUARE, Aspect.OPPOSITION]
-        
-        base_favorable = aspect in favorable_aspects
+        base_favorable = aspect is Aspect.CONJUNCTION or aspect in _SOFT_ASPECTS
         
         # Mutual reception can overcome bad aspects
         if reception in ["mutual_rulership", "mutual_exaltation", "mixed_reception"]:
@@ -4446,10 +4594,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _is_aspect_favorable_enhanced(self, aspect: Aspect, reception: str, chart: HoraryChart, querent: Planet, quesited: Planet) -> Tuple[bool, List[str]]:
         """Enhanced aspect favorability returning penalty reasons for weak/cadent conditions"""
         
-        favorable_aspects = [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-        unfavorable_aspects = [Aspect.SQUARE, Aspect.OPPOSITION]
-        
-        base_favorable = aspect in favorable_aspects
+        base_favorable = aspect is Aspect.CONJUNCTION or aspect in _SOFT_ASPECTS
 
         # Mutual reception can overcome bad aspects completely
         if reception in ["mutual_rulership", "mutual_exaltation", "mixed_reception"]:
@@ -4471,7 +4616,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if querent_pos.dignity_score < -5:
                 penalty_reasons.append(f"{querent.value} severely weak (dignity {querent_pos.dignity_score})")
 
-        if aspect in unfavorable_aspects:
+        if aspect in _HARD_ASPECTS:
             return False, penalty_reasons
 
         return base_favorable, penalty_reasons
@@ -4514,11 +4659,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "planet": planet.value,
                 "distance_from_sun": round(analysis.distance_from_sun, 4),
                 "condition": analysis.condition.condition_name,
-                "dignity_modifier": analysis.condition.dignity_modifier if not (ignore_combustion and analysis.condition in [SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS]) else 0,
+                "dignity_modifier": analysis.condition.dignity_modifier if not (ignore_combustion and analysis.condition in _SOLAR_IMPEDIMENTS) else 0,
                 "description": analysis.condition.description,
                 "exact_cazimi": bool(analysis.exact_cazimi),
                 "traditional_exception": bool(analysis.traditional_exception),
-                "effect_ignored": ignore_combustion and analysis.condition in [SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS]
+                "effect_ignored": ignore_combustion and analysis.condition in _SOLAR_IMPEDIMENTS
             }
         
         return {
@@ -4542,19 +4687,19 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         config = cfg()
         querent_pos = chart.planets[querent_planet]
         quesited_pos = chart.planets[quesited_planet] 
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
         
         # Traditional theft/loss denial factors
         
         # 1. L2 (possessions) severely afflicted and cadent
         if quesited_planet == chart.house_rulers[2]:  # L2 question
-            angularity = self.calculator._get_traditional_angularity(quesited_pos.longitude, chart.houses, quesited_pos.house)
+            angularity = self._planet_angularity(chart, quesited_planet)
             
             if angularity == "cadent" and quesited_pos.dignity_score <= -5:
                 denial_reasons.append(f"L2 ({quesited_planet.value}) cadent and severely afflicted (dignity {quesited_pos.dignity_score}) - item likely destroyed/irretrievable")
         
         # 2. Combustion of significators (traditional theft indicator)
-        sun_pos = chart.planets[Planet.SUN]
+        sun_pos = chart.sun
         for planet, description in [(querent_planet, "querent"), (quesited_planet, "quesited")]:
             planet_pos = chart.planets[planet]
             distance = abs(planet_pos.longitude - sun_pos.longitude)
@@ -4674,16 +4819,15 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # Get all translator aspects
         translator_aspects = []
-        for aspect in chart.aspects:
-            if aspect.planet1 == translator or aspect.planet2 == translator:
-                # Skip the separating and applying aspects we already know about
-                other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
-                if (other_planet == separating_aspect.planet2 if separating_aspect.planet1 == translator else separating_aspect.planet1):
-                    continue  # This is the separating aspect
-                if (other_planet == applying_aspect.planet2 if applying_aspect.planet1 == translator else applying_aspect.planet1):
-                    continue  # This is the applying aspect
-                    
-                translator_aspects.append(aspect)
+        for aspect in chart.aspects_by_planet.get(translator, ()):
+            # Skip the separating and applying aspects we already know about
+            other_planet = aspect.planet2 if aspect.planet1 == translator else aspect.planet1
+            if (other_planet == separating_aspect.planet2 if separating_aspect.planet1 == translator else separating_aspect.planet1):
+                continue  # This is the separating aspect
+            if (other_planet == applying_aspect.planet2 if applying_aspect.planet1 == translator else applying_aspect.planet1):
+                continue  # This is the applying aspect
+                
+            translator_aspects.append(aspect)
         
         # Check if any applying aspects occur between separation and application
         for aspect in translator_aspects:
@@ -4700,33 +4844,28 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _is_aspect_within_orb_limits(self, chart: HoraryChart, aspect) -> bool:
         """Check if aspect is within proper orb limits using moiety-based calculation"""
         
-        # Get planet positions
-        planet1 = aspect.planet1
-        planet2 = aspect.planet2
-        
-        pos1 = chart.planets[planet1]
-        pos2 = chart.planets[planet2]
-        
         # Calculate moiety-based orb limit
-        moiety1 = self._get_planet_moiety(planet1)
-        moiety2 = self._get_planet_moiety(planet2)
-        max_orb = moiety1 + moiety2
+        max_orb = self._get_planet_moiety(aspect.planet1) + self._get_planet_moiety(aspect.planet2)
         
         # Check if current orb is within the limit
         return aspect.orb <= max_orb
     
+    def _aspects_within_orb_by_planet(self, chart: HoraryChart) -> Dict[Planet, Tuple[Any, ...]]:
+        """``chart.aspects_by_planet`` limited to aspects within moiety orbs, memoized on the chart"""
+        cached = chart._aspects_within_orb
+        if cached is None:
+            within_orb = {id(aspect) for aspect in chart.aspects if self._is_aspect_within_orb_limits(chart, aspect)}
+            if len(within_orb) < len(chart.aspects):
+                logger.debug(f"{len(chart.aspects) - len(within_orb)} aspect(s) exceed moiety orb limits")
+            cached = chart._aspects_within_orb = {
+                planet: tuple(aspect for aspect in aspects if id(aspect) in within_orb)
+                for planet, aspects in chart.aspects_by_planet.items()
+            }
+        return cached
+    
     def _get_planet_moiety(self, planet: Planet) -> float:
         """Get traditional moiety for planet"""
-        moieties = {
-            Planet.SUN: 17.0,
-            Planet.MOON: 12.5,
-            Planet.MERCURY: 7.0,
-            Planet.VENUS: 8.0,
-            Planet.MARS: 7.5,
-            Planet.JUPITER: 9.0,
-            Planet.SATURN: 9.5
-        }
-        return moieties.get(planet, 8.0)  # Default orb if not found
+        return _TRADITIONAL_MOIETIES.get(planet, 8.0)  # Default orb if not found
     
     def _validate_translation_sequence_timing(self, chart: HoraryChart, translator: Planet, 
                                             separating_aspect, applying_aspect) -> bool:
@@ -4796,6 +4935,9 @@ class HoraryEngine:
         ignore_void_moon = settings.get("ignore_void_moon", False)
         ignore_combustion = settings.get("ignore_combustion", False)
         ignore_saturn_7th = settings.get("ignore_saturn_7th", False)
+        compute_general = settings.get("compute_general", True)
+        return_payload = settings.get("return_payload", "full")
+        detailed = settings.get("detailed", True)
         
         # Extract reception weighting (now configurable)
         exaltation_confidence_boost = settings.get("exaltation_confidence_boost")
@@ -4818,7 +4960,10 @@ class HoraryEngine:
                 ignore_void_moon=ignore_void_moon,
                 ignore_combustion=ignore_combustion,
                 ignore_saturn_7th=ignore_saturn_7th,
-                exaltation_confidence_boost=exaltation_confidence_boost
+                exaltation_confidence_boost=exaltation_confidence_boost,
+                compute_general=compute_general,
+                return_payload=return_payload,
+                detailed=detailed
             )
             logger.info("self.engine.judge_question() completed successfully")
         except Exception as engine_error:
@@ -5009,7 +5154,7 @@ class TraditionalOverrides:
     def check_moon_translation_clean(chart, querent, quesited):
         """Check if Moon translates light cleanly between significators"""
         
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
         
         # Find Moon's aspects to both significators
         moon_to_querent = None
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 from enum import Enum
+from types import MappingProxyType
+from typing import Mapping
 
 from .polarity import Polarity
 try:
@@ -28,7 +30,8 @@ class TestimonyKey(Enum):
 TestimonyKey.__test__ = False
 
 
-POLARITY_TABLE: dict[TestimonyKey, Polarity] = {
+# Tables are frozen read-only views: the testimony domain is fixed at import.
+POLARITY_TABLE: Mapping[TestimonyKey, Polarity] = MappingProxyType({
     # Favorable Moon applying trine to the examiner (Sun in education questions)
     TestimonyKey.MOON_APPLYING_TRINE_EXAMINER_SUN: Polarity.POSITIVE,
     # Example negative testimony
@@ -42,9 +45,9 @@ POLARITY_TABLE: dict[TestimonyKey, Polarity] = {
     # Debility indicators
     TestimonyKey.ESSENTIAL_DETRIMENT: Polarity.NEGATIVE,
     TestimonyKey.ACCIDENTAL_RETROGRADE: Polarity.NEGATIVE,
-}
+})
 
-WEIGHT_TABLE: dict[TestimonyKey, float] = {
+WEIGHT_TABLE: Mapping[TestimonyKey, float] = MappingProxyType({
     TestimonyKey.MOON_APPLYING_TRINE_EXAMINER_SUN: 1.0,
     TestimonyKey.MOON_APPLYING_SQUARE_EXAMINER_SUN: 1.0,
     TestimonyKey.L10_FORTUNATE: 1.0,
@@ -54,19 +57,39 @@ WEIGHT_TABLE: dict[TestimonyKey, float] = {
     # Debility weights sourced from rule pack
     TestimonyKey.ESSENTIAL_DETRIMENT: abs(get_rule_weight("MOD2")),
     TestimonyKey.ACCIDENTAL_RETROGRADE: abs(get_rule_weight("MOD3")),
-}
+})
 
 
 # ``family``/``kind`` tagging for group-based contribution control
-FAMILY_TABLE: dict[TestimonyKey, str] = {
+FAMILY_TABLE: Mapping[TestimonyKey, str] = MappingProxyType({
     TestimonyKey.PERFECTION_DIRECT: "perfection",
     TestimonyKey.PERFECTION_TRANSLATION_OF_LIGHT: "perfection",
     TestimonyKey.PERFECTION_COLLECTION_OF_LIGHT: "perfection",
-}
+})
 
-KIND_TABLE: dict[TestimonyKey, str] = {
+KIND_TABLE: Mapping[TestimonyKey, str] = MappingProxyType({
     TestimonyKey.PERFECTION_DIRECT: "direct",
     TestimonyKey.PERFECTION_TRANSLATION_OF_LIGHT: "tol",
     TestimonyKey.PERFECTION_COLLECTION_OF_LIGHT: "col",
-}
+})
 
+
+# Combined view of the tables above so aggregators resolve polarity, weight,
+# family and kind for a token with a single lookup instead of four.
+TESTIMONY_LOOKUP: Mapping[
+    TestimonyKey, tuple[Polarity, float, str | None, str | None]
+] = MappingProxyType({
+    key: (
+        POLARITY_TABLE.get(key, Polarity.NEUTRAL),
+        WEIGHT_TABLE.get(key, 0.0),
+        FAMILY_TABLE.get(key),
+        KIND_TABLE.get(key),
+    )
+    for key in TestimonyKey
+})
+
+
+def lookup(token: TestimonyKey) -> tuple[Polarity, float, str | None, str | None]:
+    """Return ``(polarity, weight, family, kind)`` for a testimony token."""
+
+    return TESTIMONY_LOOKUP.get(token, (Polarity.NEUTRAL, 0.0, None, None))
@@ -12,6 +12,9 @@ except ImportError:  # pragma: no cover - fallback when executed as script
     from models import HoraryChart, Planet, Sign
 
 
+# Signs in zodiacal order, indexed by ``int(longitude // 30)``
+_SIGNS_BY_INDEX = tuple(sorted(Sign, key=lambda s: s.start_degree))
+
 PLANET_SEQUENCE = [
     Planet.SATURN,
     Planet.JUPITER,
@@ -116,7 +119,7 @@ def check_planetary_hour_agreement(chart: HoraryChart, config) -> Dict[str, Any]
     start_idx = PLANET_SEQUENCE.index(day_ruler)
     hour_ruler = PLANET_SEQUENCE[(start_idx + hour_index) % 7]
 
-    asc_sign = list(Sign)[int((chart.ascendant % 360) // 30)]
+    asc_sign = _SIGNS_BY_INDEX[int((chart.ascendant % 360) // 30) % 12]
     asc_ruler = asc_sign.ruler
 
     mode = getattr(config.radicality, "hour_agreement_mode", "ruler")
@@ -201,7 +204,7 @@ def check_enhanced_radicality(chart: HoraryChart, ignore_saturn_7th: bool = Fals
 
     # Via Combusta (configurable)
     if config.radicality.via_combusta_enabled:
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
         moon_degree_in_sign = moon_pos.longitude % 30
 
         via_combusta = config.radicality.via_combusta
@@ -10,43 +10,48 @@ except ImportError:  # pragma: no cover - fallback when executed as script
     from models import Planet, Sign, HoraryChart
 
 
+# Traditional exaltations
+_EXALTATIONS: Dict[Planet, Sign] = {
+    Planet.SUN: Sign.ARIES,
+    Planet.MOON: Sign.TAURUS,
+    Planet.MERCURY: Sign.VIRGO,
+    Planet.VENUS: Sign.PISCES,
+    Planet.MARS: Sign.CAPRICORN,
+    Planet.JUPITER: Sign.CANCER,
+    Planet.SATURN: Sign.LIBRA,
+}
+
+# Traditional triplicity rulers as (day, night)
+_TRIPLICITY_RULERS: Dict[Sign, Tuple[Planet, Planet]] = {
+    # Fire signs (Aries, Leo, Sagittarius)
+    Sign.ARIES: (Planet.SUN, Planet.JUPITER),
+    Sign.LEO: (Planet.SUN, Planet.JUPITER),
+    Sign.SAGITTARIUS: (Planet.SUN, Planet.JUPITER),
+
+    # Earth signs (Taurus, Virgo, Capricorn)
+    Sign.TAURUS: (Planet.VENUS, Planet.MOON),
+    Sign.VIRGO: (Planet.VENUS, Planet.MOON),
+    Sign.CAPRICORN: (Planet.VENUS, Planet.MOON),
+
+    # Air signs (Gemini, Libra, Aquarius)
+    Sign.GEMINI: (Planet.SATURN, Planet.MERCURY),
+    Sign.LIBRA: (Planet.SATURN, Planet.MERCURY),
+    Sign.AQUARIUS: (Planet.SATURN, Planet.MERCURY),
+
+    # Water signs (Cancer, Scorpio, Pisces)
+    Sign.CANCER: (Planet.MARS, Planet.VENUS),
+    Sign.SCORPIO: (Planet.MARS, Planet.VENUS),
+    Sign.PISCES: (Planet.MARS, Planet.VENUS),
+}
+
+
 class TraditionalReceptionCalculator:
     """Centralized reception calculator - single source of truth for all reception logic"""
 
     def __init__(self) -> None:
-        # Traditional exaltations
-        self.exaltations = {
-            Planet.SUN: Sign.ARIES,
-            Planet.MOON: Sign.TAURUS,
-            Planet.MERCURY: Sign.VIRGO,
-            Planet.VENUS: Sign.PISCES,
-            Planet.MARS: Sign.CAPRICORN,
-            Planet.JUPITER: Sign.CANCER,
-            Planet.SATURN: Sign.LIBRA,
-        }
-
-        # Traditional triplicity rulers (day/night)
-        self.triplicity_rulers = {
-            # Fire signs (Aries, Leo, Sagittarius)
-            Sign.ARIES: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.LEO: {"day": Planet.SUN, "night": Planet.JUPITER},
-            Sign.SAGITTARIUS: {"day": Planet.SUN, "night": Planet.JUPITER},
-
-            # Earth signs (Taurus, Virgo, Capricorn)
-            Sign.TAURUS: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.VIRGO: {"day": Planet.VENUS, "night": Planet.MOON},
-            Sign.CAPRICORN: {"day": Planet.VENUS, "night": Planet.MOON},
-
-            # Air signs (Gemini, Libra, Aquarius)
-            Sign.GEMINI: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.LIBRA: {"day": Planet.SATURN, "night": Planet.MERCURY},
-            Sign.AQUARIUS: {"day": Planet.SATURN, "night": Planet.MERCURY},
-
-            # Water signs (Cancer, Scorpio, Pisces)
-            Sign.CANCER: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.SCORPIO: {"day": Planet.MARS, "night": Planet.VENUS},
-            Sign.PISCES: {"day": Planet.MARS, "night": Planet.VENUS},
-        }
+        # Shared module-level tables; calculators are created per evaluation
+        self.exaltations = _EXALTATIONS
+        self.triplicity_rulers = _TRIPLICITY_RULERS
 
     def calculate_comprehensive_reception(
         self, chart: HoraryChart, planet1: Planet, planet2: Planet
@@ -59,9 +64,7 @@ class TraditionalReceptionCalculator:
         pos2 = chart.planets[planet2]
 
         # Determine day/night for triplicity calculations
-        sun_pos = chart.planets[Planet.SUN]
-        sun_house = self._calculate_house_position(sun_pos.longitude, chart.houses)
-        is_day = sun_house in [7, 8, 9, 10, 11, 12]  # Sun below horizon = day chart
+        is_day = chart.sun.house >= 7  # Sun below horizon (houses 7-12) = day chart
 
         # Check all dignity types for both directions
         reception_1_to_2 = self._check_all_dignities(planet1, pos2, is_day)
@@ -115,10 +118,7 @@ class TraditionalReceptionCalculator:
             dignities.append("domicile")
 
         # 2. Exaltation (second strongest)
-        if (
-            receiving_planet in self.exaltations
-            and self.exaltations[receiving_planet] == received_position.sign
-        ):
+        if self.exaltations.get(receiving_planet) is received_position.sign:
             dignities.append("exaltation")
 
         # 3. Triplicity (third strongest)
@@ -162,11 +162,11 @@ class TraditionalReceptionCalculator:
 
     def _has_triplicity_dignity(self, planet: Planet, sign: Sign, is_day: bool) -> bool:
         """Check if planet has triplicity dignity in sign"""
-        if sign not in self.triplicity_rulers:
+        rulers = self.triplicity_rulers.get(sign)
+        if rulers is None:
             return False
 
-        sect = "day" if is_day else "night"
-        return self.triplicity_rulers[sign][sect] == planet
+        return rulers[0 if is_day else 1] == planet
 
     def _classify_reception(
         self,
@@ -286,20 +286,3 @@ class TraditionalReceptionCalculator:
         synergy = 1 if (strength_a >= 3 or strength_b >= 3) else 0
 
         return base_strength + synergy
-
-    def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
-        """Helper method for house calculation"""
-        longitude = longitude % 360
-
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
-
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
-
-        return 1
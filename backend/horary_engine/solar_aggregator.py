@@ -4,13 +4,7 @@ from __future__ import annotations
 from typing import Iterable, List, Tuple, Dict, Sequence
 import re
 
-from .polarity_weights import (
-    POLARITY_TABLE,
-    WEIGHT_TABLE,
-    FAMILY_TABLE,
-    KIND_TABLE,
-    TestimonyKey,
-)
+from .polarity_weights import TestimonyKey, lookup
 from .polarity import Polarity
 from .dsl import RoleImportance
 
@@ -50,18 +44,14 @@ def aggregate(
             continue
         seen.add(token)
 
-        polarity = POLARITY_TABLE.get(token, Polarity.NEUTRAL)
+        polarity, weight, family, kind = lookup(token)
         if polarity is Polarity.NEUTRAL:
             continue
 
-        family = FAMILY_TABLE.get(token)
-        kind = KIND_TABLE.get(token)
         context_only = family is not None and family in families_seen
         if family is not None and not context_only:
             families_seen.add(family)
 
-        weight = WEIGHT_TABLE.get(token, 0.0)
-
         role_factor = 1.0
         token_name = token.value.lower()
         for role_name, factor in role_weights.items():
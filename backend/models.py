@@ -1,6 +1,6 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Tuple, Optional
+from typing import Any, Dict, FrozenSet, List, Tuple, Optional
 import datetime
 import logging
 from horary_config import cfg
@@ -135,6 +135,13 @@ class Significator:
 
 @dataclass
 class HoraryChart:
+    """A calculated horary chart.
+
+    Charts are treated as immutable once constructed: derived indexes are
+    built from the fields in ``__post_init__`` and the engine memoizes on the
+    chart, so changing a field in place leaves them stale. Use
+    ``dataclasses.replace`` to get a chart with different fields.
+    """
     date_time: datetime.datetime
     date_time_utc: datetime.datetime  # UTC time for calculations
     timezone_info: str  # Timezone information
@@ -150,4 +157,59 @@ class HoraryChart:
     julian_day: float = 0.0
     moon_last_aspect: Optional[LunarAspect] = None
     moon_next_aspect: Optional[LunarAspect] = None
+    # Direct handles on the luminaries, resolved from ``planets`` at construction
+    moon: Optional[PlanetPosition] = field(default=None, init=False, repr=False, compare=False)
+    sun: Optional[PlanetPosition] = field(default=None, init=False, repr=False, compare=False)
+    # Houses ruled by each planet, in ``house_rulers`` order; not updated if
+    # ``house_rulers`` is mutated
+    houses_by_ruler: Dict[Planet, Tuple[int, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Aspects each planet takes part in, in ``aspects`` order; not updated if
+    # ``aspects`` is mutated
+    aspects_by_planet: Dict[Planet, Tuple[AspectInfo, ...]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # Planets whose solar analysis is Combustion; not updated if
+    # ``solar_analyses`` is mutated
+    combust_planets: FrozenSet[Planet] = field(
+        default=frozenset(), init=False, repr=False, compare=False
+    )
+    # Engine memo: traditional angularity per planet, filled on demand
+    _angularity: Optional[Dict[Planet, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Engine memo: ``aspects_by_planet`` limited to aspects within moiety orbs
+    _aspects_within_orb: Optional[Dict[Planet, Tuple[AspectInfo, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Engine memo: (configuration, void-of-course result) for the Moon
+    _void_cache: Optional[Tuple[Any, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Engine memos: (configuration, results) for Moon testimony keyed by
+    # (querent, quesited, ignore_void_moon) and reception keyed by planet pair
+    _moon_testimony_cache: Optional[Tuple[Any, Dict[Tuple[Planet, Planet, bool], Dict[str, Any]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _reception_cache: Optional[Tuple[Any, Dict[Tuple[Planet, Planet], Dict[str, Any]]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.moon = self.planets.get(Planet.MOON)
+        self.sun = self.planets.get(Planet.SUN)
+        houses_by_ruler: Dict[Planet, List[int]] = {}
+        for house, ruler in self.house_rulers.items():
+            houses_by_ruler.setdefault(ruler, []).append(house)
+        self.houses_by_ruler = {ruler: tuple(houses) for ruler, houses in houses_by_ruler.items()}
+        aspects_by_planet: Dict[Planet, List[AspectInfo]] = {}
+        for aspect in self.aspects:
+            aspects_by_planet.setdefault(aspect.planet1, []).append(aspect)
+            aspects_by_planet.setdefault(aspect.planet2, []).append(aspect)
+        self.aspects_by_planet = {planet: tuple(aspects) for planet, aspects in aspects_by_planet.items()}
+        self.combust_planets = frozenset(
+            planet for planet, analysis in (self.solar_analyses or {}).items()
+            if analysis.condition is SolarCondition.COMBUSTION
+        )
 
@@ -122,11 +122,16 @@ CATEGORY_DEFAULTS: Dict[Category, Dict[str, Any]] = {
 }
 
 
+# Legacy category strings that have already triggered a deprecation warning
+_LEGACY_WARNED: set[str] = set()
+
+
 def resolve_category(value: Optional[str | Category]) -> Optional[Category]:
     """Resolve a category value to :class:`Category`.
 
     Accepts either a :class:`Category` instance or its string value. When a
-    legacy string is provided, a deprecation warning is logged.
+    legacy string is provided, a deprecation warning is logged the first time
+    that string is seen.
     """
 
     if value is None or value == "":
@@ -138,7 +143,9 @@ def resolve_category(value: Optional[str | Category]) -> Optional[Category]:
     except ValueError as exc:  # pragma: no cover - defensive
         logger.warning("Unknown category '%s'", value)
         raise exc
-    logger.warning("Legacy category string '%s' used; prefer Category.%s", value, cat.name)
+    if value not in _LEGACY_WARNED:
+        _LEGACY_WARNED.add(value)
+        logger.warning("Legacy category string '%s' used; prefer Category.%s", value, cat.name)
     return cat
 
 
@@ -0,0 +1,66 @@
+import datetime
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+try:
+    from ..horary_engine import engine as engine_module
+    from ..horary_engine.engine import (
+        EnhancedTraditionalAstrologicalCalculator,
+        calculate_charts_batch,
+    )
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from horary_engine import engine as engine_module
+    from horary_engine.engine import (
+        EnhancedTraditionalAstrologicalCalculator,
+        calculate_charts_batch,
+    )
+
+
+def _request(hour):
+    dt = datetime.datetime(2024, 3, 1, hour, 0)
+    return (dt, dt, "UTC", 51.5, -0.1, "London")
+
+
+def test_batch_matches_serial_calculation_in_order():
+    requests = [_request(6), _request(18)]
+
+    charts = calculate_charts_batch(requests, max_workers=2)
+
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    expected = [calculator.calculate_chart(*req) for req in requests]
+    assert [c.julian_day for c in charts] == [c.julian_day for c in expected]
+    assert [c.ascendant for c in charts] == [c.ascendant for c in expected]
+    assert charts[0].planets.keys() == expected[0].planets.keys()
+
+
+def test_batch_empty():
+    assert calculate_charts_batch([]) == []
+
+
+def test_repeated_chart_is_served_from_cache_as_independent_copy(monkeypatch):
+    calculator = EnhancedTraditionalAstrologicalCalculator()
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+
+    first = calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London")
+    first.planets.clear()
+
+    calls = []
+    real_calc_planet_ut = engine_module.calc_planet_ut
+
+    def spy(*args, **kwargs):
+        calls.append(args)
+        return real_calc_planet_ut(*args, **kwargs)
+
+    monkeypatch.setattr(engine_module, "calc_planet_ut", spy)
+    second = calculator.calculate_chart(dt, dt, "Europe/London", 51.5, -0.1, "Home")
+
+    assert calls == []
+    assert len(calculator._chart_cache) == 1
+    assert second.planets
+    assert second.timezone_info == "Europe/London"
+    assert second.location_name == "Home"
+    assert second.julian_day == first.julian_day
@@ -0,0 +1,114 @@
+import datetime
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import (
+    Planet,
+    PlanetPosition,
+    Sign,
+    Aspect,
+    AspectInfo,
+    HoraryChart,
+    SolarAnalysis,
+    SolarCondition,
+)
+
+
+def _make_chart(planets, aspects, house_rulers, combust) -> HoraryChart:
+    now = datetime.datetime.utcnow()
+    return HoraryChart(
+        date_time=now,
+        date_time_utc=now,
+        timezone_info="UTC",
+        location=(0.0, 0.0),
+        location_name="Nowhere",
+        planets=planets,
+        aspects=aspects,
+        houses=[0.0] * 12,
+        house_rulers=house_rulers,
+        ascendant=0.0,
+        midheaven=0.0,
+        solar_analyses={
+            planet: SolarAnalysis(planet, 2.0, SolarCondition.COMBUSTION) for planet in combust
+        },
+        julian_day=0.0,
+        moon_last_aspect=None,
+        moon_next_aspect=None,
+    )
+
+
+def _transaction_chart(combust) -> HoraryChart:
+    planets = {
+        Planet.SUN: PlanetPosition(Planet.SUN, 100.0, 0.0, 4, Sign.CANCER, 0, speed=1.0),
+        Planet.MOON: PlanetPosition(Planet.MOON, 40.0, 0.0, 2, Sign.TAURUS, 0, speed=13.0),
+        Planet.MARS: PlanetPosition(Planet.MARS, 160.0, 0.0, 6, Sign.VIRGO, 0, speed=0.5),
+        Planet.VENUS: PlanetPosition(Planet.VENUS, 250.0, 0.0, 9, Sign.SAGITTARIUS, 0, speed=1.1),
+        Planet.MERCURY: PlanetPosition(Planet.MERCURY, 102.0, 0.0, 4, Sign.CANCER, 0, speed=1.5),
+    }
+    aspects = [
+        AspectInfo(planet1=Planet.MERCURY, planet2=Planet.MOON, aspect=Aspect.SEXTILE,
+                   orb=2.0, applying=False, degrees_to_exact=2.0),
+        AspectInfo(planet1=Planet.MERCURY, planet2=Planet.MARS, aspect=Aspect.SEXTILE,
+                   orb=2.0, applying=True, degrees_to_exact=2.0),
+    ]
+    return _make_chart(planets, aspects, {1: Planet.MARS, 7: Planet.VENUS}, combust)
+
+
+def test_combust_translator_loses_confidence():
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    clean = engine._check_transaction_translation(
+        _transaction_chart(()), Planet.MARS, Planet.VENUS, Planet.MOON
+    )
+    combust = engine._check_transaction_translation(
+        _transaction_chart({Planet.MERCURY}), Planet.MARS, Planet.VENUS, Planet.MOON
+    )
+    ignored = engine._check_transaction_translation(
+        _transaction_chart({Planet.MERCURY}), Planet.MARS, Planet.VENUS, Planet.MOON,
+        ignore_combustion=True,
+    )
+    assert clean["translator"] == combust["translator"] == Planet.MERCURY
+    assert combust["confidence"] == clean["confidence"] - 10
+    assert ignored["confidence"] == clean["confidence"]
+
+
+
+def _judge_real_chart(dt, lat, lon, question, ignore_combustion=False):
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", lat, lon, "Test")
+    question_analysis = engine.question_analyzer.analyze_question(question)
+    result = engine._apply_enhanced_judgment(
+        chart, question_analysis, window_days=90, ignore_combustion=ignore_combustion
+    )
+    return engine, chart, result
+
+
+def test_sun_significator_conjunct_combust_significator_is_denied():
+    # L1 Sun applies by conjunction to L7 Saturn, combust at 8°
+    dt = datetime.datetime(2020, 1, 4, 19, 0)
+    engine, chart, result = _judge_real_chart(dt, 51.5, -0.1, "Will he come back?")
+    assert (chart.house_rulers[1], chart.house_rulers[7]) == (Planet.SUN, Planet.SATURN)
+    assert Planet.SATURN in chart.combust_planets
+
+    perfection = engine._check_enhanced_perfection(chart, Planet.SUN, Planet.SATURN)
+    assert perfection["type"] == "combustion_denial"
+    assert result["result"] == "NO"
+
+    _, _, ignored = _judge_real_chart(
+        dt, 51.5, -0.1, "Will he come back?", ignore_combustion=True
+    )
+    assert ignored["result"] == "YES"
+    assert ignored["traditional_factors"]["perfection_type"] == "direct"
+
+
+def test_sun_applying_to_combust_10th_ruler_is_noted():
+    dt = datetime.datetime(2022, 2, 2, 11, 10)
+    engine, chart, result = _judge_real_chart(dt, 16.57, -27.04, "Will I win the lawsuit?")
+    assert engine._check_sun_applying_to_10th_ruler(chart) == {"ruler": Planet.SATURN, "combust": True}
+    assert "Combustion on 10th ruler mitigated" in result["reasoning"]
+
+    assert engine._check_sun_applying_to_10th_ruler(chart, ignore_combustion=True)["combust"] is False
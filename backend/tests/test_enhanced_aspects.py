@@ -0,0 +1,70 @@
+import datetime
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+try:
+    from ..horary_engine.aspects import calculate_enhanced_aspects
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from horary_engine.aspects import calculate_enhanced_aspects
+
+try:
+    from ..models import Aspect, Planet, PlanetPosition, Sign
+except ImportError:  # pragma: no cover - fallback for direct execution
+    from models import Aspect, Planet, PlanetPosition, Sign
+
+
+def make_pos(planet, lon, speed):
+    return PlanetPosition(
+        planet=planet,
+        longitude=lon,
+        latitude=0.0,
+        house=1,
+        sign=list(Sign)[int(lon // 30)],
+        dignity_score=0,
+        speed=speed,
+        retrograde=speed < 0,
+    )
+
+
+def test_tightest_aspect_selected_when_orbs_overlap():
+    # Sun/Moon moieties allow 15.3° for both square and trine, so a 105.2°
+    # separation falls within both; the trine is the tighter of the two.
+    planets = {
+        Planet.SUN: make_pos(Planet.SUN, 0.0, 1.0),
+        Planet.MOON: make_pos(Planet.MOON, 105.2, 13.0),
+    }
+
+    aspects = calculate_enhanced_aspects(planets, jd_ut=2451545.0)
+
+    assert len(aspects) == 1
+    assert aspects[0].aspect == Aspect.TRINE
+    assert abs(aspects[0].orb - 14.8) < 1e-9
+
+
+def test_exact_time_resolved_to_datetime():
+    planets = {
+        Planet.SUN: make_pos(Planet.SUN, 10.0, 1.0),
+        Planet.MOON: make_pos(Planet.MOON, 5.0, 13.0),
+    }
+
+    aspects = calculate_enhanced_aspects(planets, jd_ut=2451545.0)
+
+    assert len(aspects) == 1
+    exact_time = aspects[0].exact_time
+    # 5° at 12°/day relative speed from J2000.0 (2000-01-01 12:00 UT)
+    assert isinstance(exact_time, datetime.datetime)
+    expected = datetime.datetime(2000, 1, 1, 22, 0)
+    assert abs(exact_time - expected) < datetime.timedelta(minutes=1)
+
+
+def test_no_aspect_outside_orb():
+    planets = {
+        Planet.MARS: make_pos(Planet.MARS, 0.0, 0.5),
+        Planet.SATURN: make_pos(Planet.SATURN, 35.0, 0.05),
+    }
+
+    assert calculate_enhanced_aspects(planets, jd_ut=2451545.0) == []
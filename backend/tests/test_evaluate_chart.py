@@ -0,0 +1,45 @@
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+import evaluate_chart as evaluate_chart_module
+from horary_config import get_config
+from evaluate_chart import evaluate_chart, evaluate_charts_batch
+
+
+def test_batch_matches_sequential_order():
+    charts = [{"category": ""}, {"category": "education"}, {}]
+
+    batch = evaluate_charts_batch(charts, use_dsl=False, max_workers=2)
+
+    assert len(batch) == len(charts)
+    for chart, result in zip(charts, batch):
+        assert result == evaluate_chart(chart, use_dsl=False)
+
+
+def test_batch_empty():
+    assert evaluate_charts_batch([]) == []
+
+
+def test_default_use_dsl_reread_on_invalidate(monkeypatch):
+    # Restore the import-time default for later tests
+    monkeypatch.setattr(
+        evaluate_chart_module, "_DEFAULT_USE_DSL", evaluate_chart_module._DEFAULT_USE_DSL
+    )
+    monkeypatch.setenv("HORARY_USE_DSL", "false")
+    evaluate_chart_module._invalidate()
+    assert evaluate_chart_module._DEFAULT_USE_DSL is False
+
+    monkeypatch.setenv("HORARY_USE_DSL", "true")
+    assert evaluate_chart_module._DEFAULT_USE_DSL is False
+    evaluate_chart_module._invalidate()
+    assert evaluate_chart_module._DEFAULT_USE_DSL is True
+
+    monkeypatch.delenv("HORARY_USE_DSL")
+    evaluate_chart_module._invalidate()
+    assert evaluate_chart_module._DEFAULT_USE_DSL is bool(
+        get_config().get("aggregator.use_dsl", False)
+    )
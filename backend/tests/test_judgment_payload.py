@@ -0,0 +1,70 @@
+import datetime
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine import engine as engine_module
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+
+QUESTION = "Will I get the job?"
+FRONTEND_KEYS = (
+    "chart_data",
+    "general_info",
+    "considerations",
+    "moon_last_aspect",
+    "moon_next_aspect",
+)
+
+
+def _judge(hour=12, **kwargs):
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2024, 3, 1, hour, 0)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London")
+    question_analysis = engine.question_analyzer.analyze_question(QUESTION)
+    return engine._judge_chart(chart, QUESTION, question_analysis, **kwargs)
+
+
+def test_judgment_only_omits_frontend_payload():
+    full = _judge()
+    judgment_only = _judge(return_payload="judgment_only")
+
+    for key in FRONTEND_KEYS:
+        assert key in full
+        assert key not in judgment_only
+    for key in ("judgment", "confidence", "reasoning", "timing", "traditional_factors", "solar_factors"):
+        assert judgment_only[key] == full[key]
+
+
+def test_unknown_return_payload_raises():
+    with pytest.raises(ValueError, match="Unknown return_payload"):
+        _judge(return_payload="summary")
+
+
+def test_judge_question_reports_unknown_return_payload(monkeypatch):
+    monkeypatch.setattr(engine_module, "safe_geocode", lambda location: (51.5, -0.1, "London"))
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+
+    result = engine.judge_question(
+        QUESTION, "London", date_str="2024-03-01", time_str="12:00",
+        timezone_str="UTC", use_current_time=False, return_payload="summary",
+    )
+
+    assert result["judgment"] == "ERROR"
+    assert "Unknown return_payload" in result["error"]
+
+
+@pytest.mark.parametrize("hour", [0, 6, 12, 18])
+def test_summary_mode_empties_factors_only(hour):
+    full = _judge(hour)
+    summary = _judge(hour, detailed=False)
+
+    assert full["traditional_factors"]
+    assert summary["traditional_factors"] == {}
+    assert summary["solar_factors"] == {}
+    for key in ("judgment", "confidence", "reasoning", "timing"):
+        assert summary[key] == full[key]
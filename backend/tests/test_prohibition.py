@@ -91,3 +91,15 @@ def test_venus_saturn_prohibits_future_sextile():
     assert result["prohibitor"] == Planet.SATURN
     assert result["significator"] == Planet.VENUS
     assert result["t_prohibition"] == pytest.approx(5.57, rel=0.05)
+
+
+def test_soonest_future_aspect_picks_nearest_angle():
+    from horary_engine.engine import _soonest_future_aspect_days
+
+    fast = PlanetPosition(Planet.MOON, 10.0, 0.0, 1, Sign.ARIES, 0, speed=13.0)
+    slow = PlanetPosition(Planet.SATURN, 75.0, 0.0, 3, Sign.GEMINI, 0, speed=0.0)
+    # Conjunction needs 65° at 13°/day; every other angle lies further ahead
+    assert _soonest_future_aspect_days(fast, slow) == pytest.approx(5.0)
+
+    stalled = PlanetPosition(Planet.MARS, 10.0, 0.0, 1, Sign.ARIES, 0, speed=0.0)
+    assert _soonest_future_aspect_days(stalled, slow) is None
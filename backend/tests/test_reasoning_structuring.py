@@ -27,3 +27,15 @@ def test_structure_reasoning_radicality_weight_inferred():
             "weight": -penalty,
         }
     ]
+
+
+def test_structure_reasoning_normalizes_structured_entries():
+    entries = [
+        {"stage": "Moon", "rule": "Void of course", "weight": -5},
+        {"reason": "Legacy entry", "delta": 3},
+    ]
+    result = _structure_reasoning(entries)
+    assert result == [
+        {"stage": "Moon", "rule": "Void of course", "weight": -5},
+        {"stage": "General", "rule": "Legacy entry", "weight": 3},
+    ]
@@ -0,0 +1,36 @@
+import datetime
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Planet, SolarCondition
+
+
+def _judge(ignore_combustion):
+    # Saturn rules houses 1 and 2 and sits combust a week after its solar conjunction
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2016, 12, 18, 5, 2)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", -33.3, 17.85, "Cape Town")
+    assert chart.house_rulers[1] == chart.house_rulers[2] == Planet.SATURN
+    assert chart.solar_analyses[Planet.SATURN].condition is SolarCondition.COMBUSTION
+
+    question_analysis = engine.question_analyzer.analyze_question("Will I find my lost ring?")
+    return engine._apply_enhanced_judgment(
+        chart, question_analysis, window_days=90, ignore_combustion=ignore_combustion
+    )
+
+
+def test_combust_shared_significator_denies_unity():
+    result = _judge(ignore_combustion=False)
+    assert result["result"] == "NO"
+    assert "Same ruler unity denied: Shared significator combust/under beams" in result["reasoning"]
+
+
+def test_ignore_combustion_keeps_unity():
+    result = _judge(ignore_combustion=True)
+    assert result["result"] == "YES"
+    assert not any("unity denied" in reason for reason in result["reasoning"])
@@ -0,0 +1,52 @@
+import dataclasses
+import datetime
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.append(str(ROOT))
+sys.path.append(str(ROOT / "backend"))
+
+from horary_config import cfg
+from horary_engine.engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import SolarAnalysis, SolarCondition
+
+
+def _judge_with_combust_significators(monkeypatch, denial_enabled):
+    monkeypatch.setattr(cfg().solar, "severe_impediment_denial_enabled", denial_enabled)
+    # Solar settings are cached per configuration object and in-place edits
+    # are not seen, so each case needs its own engine
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2024, 3, 1, 12, 0)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London")
+    question_analysis = engine.question_analyzer.analyze_question("Will I get the job?")
+
+    # Put both significators (L1 Moon, L10 Jupiter) in extreme combustion
+    querent, quesited = chart.house_rulers[1], chart.house_rulers[10]
+    solar_analyses = dict(chart.solar_analyses)
+    solar_analyses[querent] = SolarAnalysis(querent, 0.5, SolarCondition.COMBUSTION)
+    solar_analyses[quesited] = SolarAnalysis(quesited, 0.8, SolarCondition.COMBUSTION)
+    chart = dataclasses.replace(chart, solar_analyses=solar_analyses)
+
+    result = engine._apply_enhanced_judgment(
+        chart, question_analysis, ignore_radicality=True, ignore_void_moon=True
+    )
+    return result, querent, quesited
+
+
+def test_severe_impediment_denial_lists_both_significators(monkeypatch):
+    result, querent, quesited = _judge_with_combust_significators(monkeypatch, True)
+
+    assert result["result"] == "NO"
+    assert result["traditional_factors"]["perfection_type"] == "impediment_denial"
+    message = result["reasoning"][-1]
+    assert message.startswith("Multiple severe solar impediments deny perfection: ")
+    assert f"{querent.value} (extreme combustion at 0.5°)" in message
+    assert f"{quesited.value} (extreme combustion at 0.8°)" in message
+
+
+def test_severe_impediment_denial_disabled_by_default(monkeypatch):
+    result, _, _ = _judge_with_combust_significators(monkeypatch, False)
+
+    assert result["traditional_factors"].get("perfection_type") != "impediment_denial"
+    assert any(reason.startswith("Solar impediment: ") for reason in result["reasoning"])
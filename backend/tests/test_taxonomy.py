@@ -9,22 +9,33 @@ sys.path.append(str(ROOT))
 sys.path.append(str(ROOT / "backend"))
 
 try:
+    from .. import taxonomy
     from ..taxonomy import Category, resolve_category, resolve, CATEGORY_DEFAULTS
     from ..category_router import get_contract
     from ..models import Planet
 except ImportError:  # pragma: no cover - fallback for direct execution
+    import taxonomy
     from taxonomy import Category, resolve_category, resolve, CATEGORY_DEFAULTS
     from category_router import get_contract
     from models import Planet
 
 
-def test_resolve_category_warns_deprecated(caplog):
+def test_resolve_category_warns_deprecated(caplog, monkeypatch):
+    monkeypatch.setattr(taxonomy, "_LEGACY_WARNED", set())
     with caplog.at_level(logging.WARNING):
         cat = resolve_category("education")
     assert cat is Category.EDUCATION
     assert "Legacy category string" in caplog.text
 
 
+def test_resolve_category_warns_once_per_string(caplog, monkeypatch):
+    monkeypatch.setattr(taxonomy, "_LEGACY_WARNED", set())
+    with caplog.at_level(logging.WARNING):
+        resolve_category("career")
+        resolve_category("career")
+    assert caplog.text.count("Legacy category string 'career'") == 1
+
+
 def test_get_contract_from_taxonomy():
     contract = get_contract(Category.EDUCATION)
     assert contract == {"examiner": Planet.SUN}
@@ -73,3 +84,11 @@ def test_shared_ruler_description():
     chart.house_rulers[7] = chart.house_rulers[1]
     result = resolve(chart, Category.RELATIONSHIP, manual_houses=[1, 7])
     assert result["description"] == "Shared Significator: Sun rules both houses 1 and 7"
+
+
+def test_get_contract_is_cached_and_read_only():
+    contract = get_contract(Category.EDUCATION)
+    assert get_contract(Category.EDUCATION) is contract
+    with pytest.raises(TypeError):
+        contract["examiner"] = Planet.MOON
+    assert CATEGORY_DEFAULTS[Category.EDUCATION]["contract"] == {"examiner": Planet.SUN}
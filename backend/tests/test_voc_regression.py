@@ -72,3 +72,23 @@ def test_voc_regression_false():
     result = engine._void_traditional_ground_truth(chart)
     assert result["void"] is False
 
+
+
+def test_void_check_memoized_on_chart():
+    engine = EnhancedTraditionalHoraryJudgmentEngine.__new__(
+        EnhancedTraditionalHoraryJudgmentEngine
+    )
+    calls = []
+
+    def fake_ground_truth(chart):
+        calls.append(chart)
+        return {"void": False, "exception": False, "reason": "test"}
+
+    engine._void_traditional_ground_truth = fake_ground_truth
+    chart = HoraryChart.__new__(HoraryChart)
+
+    first = engine._is_moon_void_of_course_enhanced(chart)
+    second = engine._is_moon_void_of_course_enhanced(chart)
+
+    assert first is second
+    assert len(calls) == 1